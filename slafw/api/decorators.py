@@ -8,7 +8,7 @@ import functools
 import logging
 from enum import Enum
 from time import monotonic
-from typing import Union, List, Any, Dict, get_type_hints
+from typing import Callable, Union, List, Any, Dict, Tuple, get_type_hints
 
 from gi.repository import GLib
 from pydbus import Variant
@@ -176,6 +176,7 @@ PYTHON_TO_DBUS_TYPE = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def python_to_dbus_type(python_type: Any) -> str:
     # TODO: Use typing.get_args and typing.get_origin once we adopt python 3.8
     if python_type in PYTHON_TO_DBUS_TYPE:
@@ -214,14 +215,20 @@ def gen_method_dbus_spec(obj: Any, name: str) -> str:
 
 
 def gen_method_dbus_args_spec(obj, signal_spec=False) -> List[str]:
+    return list(_gen_dbus_args_spec(tuple(get_type_hints(obj).items()), signal_spec))
+
+
+@functools.lru_cache(maxsize=None)
+def _gen_dbus_args_spec(type_hints: Tuple[Tuple[str, Any], ...], signal_spec: bool) -> Tuple[str, ...]:
+    # Keyed by resolved type hints, methods and signals sharing a signature share the fragments
     args = []
-    for n, t in get_type_hints(obj).items():
+    for n, t in type_hints:
         if t == type(None):  # TODO: Use types.NoneType in Python 3.10
             continue
         return_arg = n != "return" if signal_spec else n == "return"
         direction = "out" if return_arg else "in"
         args.append(f"<arg type='{python_to_dbus_type(t)}' name='{n}' direction='{direction}'/>")
-    return args
+    return tuple(args)
 
 
 def python_to_dbus_value_type(data: Any):
@@ -259,6 +266,11 @@ def wrap_value(data: Any) -> Variant:
     # pylint: disable = unidiomatic-typecheck
     # pylint: disable = too-many-return-statements
 
+    # Exact type match covers nearly all values, the checks below handle subclasses and enums
+    handler = _WRAP_VALUE_DISPATCH.get(type(data))
+    if handler:
+        return handler(data)
+
     if isinstance(data, int):
         if data > GLib.MAXINT32 or data < GLib.MININT32:  # type: ignore[operator]
             return Variant("x", data)
@@ -270,15 +282,10 @@ def wrap_value(data: Any) -> Variant:
         return wrap_dict_value(data)
 
     if isinstance(data, (tuple, frozenset)):
-        return Variant(python_to_dbus_value_type(data), data)
+        return _wrap_tuple(data)
 
     if isinstance(data, list):
-        dbus_type = python_to_dbus_value_type(data)
-        if dbus_type[1] == "v":
-            dbus_value = Variant(dbus_type, [wrap_value(d) for d in data])
-        else:
-            dbus_value = Variant(dbus_type, data)
-        return dbus_value
+        return _wrap_list(data)
 
     if isinstance(data, Enum):
         return wrap_value(data.value)
@@ -289,6 +296,23 @@ def wrap_value(data: Any) -> Variant:
     raise DBusMappingException(f"Failed to wrap dbus value \"{data}\" of type {type(data)}")
 
 
+def _wrap_int(data: int) -> Variant:
+    if data > GLib.MAXINT32 or data < GLib.MININT32:  # type: ignore[operator]
+        return Variant("x", data)
+    return Variant("i", data)
+
+
+def _wrap_tuple(data) -> Variant:
+    return Variant(python_to_dbus_value_type(data), data)
+
+
+def _wrap_list(data: list) -> Variant:
+    dbus_type = python_to_dbus_value_type(data)
+    if dbus_type[1] == "v":
+        return Variant(dbus_type, [wrap_value(d) for d in data])
+    return Variant(dbus_type, data)
+
+
 def wrap_dict_value(data):
     if data:
         first_key, _ = list(data.items())[0]
@@ -302,6 +326,21 @@ def wrap_dict_value(data):
     return Variant(signature, {key: wrap_value(val) for key, val in data.items()})
 
 
+_WRAP_VALUE_DISPATCH: Dict[type, Callable[[Any], Variant]] = {
+    **{
+        python_type: functools.partial(Variant, dbus_type)
+        for python_type, dbus_type in PYTHON_TO_DBUS_TYPE.items()
+        if python_type is not Any
+    },
+    int: _wrap_int,
+    dict: wrap_dict_value,
+    tuple: _wrap_tuple,
+    frozenset: _wrap_tuple,
+    list: _wrap_list,
+    type(None): lambda _: Variant("s", "None"),
+}
+
+
 def wrap_dict_data(data: Dict[str, Any]):
     if isinstance(data, dict):
         return {key: wrap_value(val) for key, val in data.items()}
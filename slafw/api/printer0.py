@@ -43,7 +43,7 @@ from slafw.hardware.sl1.uv_led import SL1UVLED
 from slafw.project.functions import check_ready_to_print
 from slafw.state_actions.examples import Examples
 from slafw.states.examples import ExamplesState
-from slafw.states.printer import Printer0State
+from slafw.states.printer import Printer0State, STATE0_MAP
 from slafw.wizard.data_package import fill_wizard_data_package
 from slafw.wizard.wizards.calibration import CalibrationWizard
 from slafw.wizard.wizards.displaytest import DisplayTestWizard
@@ -217,11 +217,7 @@ class Printer0:
 
         :return: Global printer state
         """
-        state = self.printer.state.to_state0()
-        if state:
-            return state.value
-
-        return Printer0State.IDLE.value
+        return STATE0_MAP.get(self.printer.state, Printer0State.IDLE).value
 
     @auto_dbus
     @property
@@ -26,7 +26,7 @@ from pydbus.generic import signal
 
 from slafw import defines
 from slafw.functions.system import get_hostname
-from slafw.states.printer import Printer0State
+from slafw.states.printer import Printer0State, STATE0_MAP
 from slafw.states.exposure import ExposureState
 from slafw.api.exposure0 import Exposure0, Exposure0State
 from slafw.errors.warnings import ResinLow, PrinterWarning
@@ -163,11 +163,7 @@ class Standard0:
 
     @property
     def _printer_state(self) -> Printer0State:
-        state = self._printer.state.to_state0()
-        if state:
-            return state
-
-        return Printer0State.IDLE
+        return STATE0_MAP.get(self._printer.state, Printer0State.IDLE)
 
     @property
     def _current_expo(self) -> Exposure:
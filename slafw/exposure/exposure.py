@@ -403,7 +403,7 @@ class Exposure:
         if self.state in cancelable_states:
             self.cancel()
         else:
-            raise NotAvailableInState(self.state, cancelable_states)
+            raise NotAvailableInState(self.state, sorted(cancelable_states, key=lambda s: s.value))
         return True
 
     def startProject(self):
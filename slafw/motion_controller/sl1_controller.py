@@ -7,7 +7,7 @@ import re
 import subprocess
 from asyncio import CancelledError, Task
 from threading import Thread
-from time import sleep
+from time import sleep, monotonic
 from typing import List, Tuple, Optional
 
 from gpiod import chip, line_request, find_line
@@ -36,6 +36,7 @@ class MotionControllerSL1(MotionControllerBase):
     FAN_UPDATE_INTERVAL_S = 3
     PORT = "/dev/ttyS2"
     REQUIRED_VERSION = "1.2.0"
+    STATE_BITS_CACHE_TTL_S = 0.05
 
     commOKStr = re.compile("^(.*)ok$")
     commErrStr = re.compile("^e(.)$")
@@ -43,7 +44,8 @@ class MotionControllerSL1(MotionControllerBase):
     def __init__(self):
         super().__init__()
         self._reader_thread: Optional[Thread] = None
-        self._old_state_bits: Optional[List[bool]] = None
+        self._old_state = -1  # All bits marked as changed on first update
+        self._state_bits_cache: Optional[Tuple[float, List[bool]]] = None
         self._value_refresh_task: Optional[Task] = None
 
         self.tower_status_changed = Signal()
@@ -56,11 +58,20 @@ class MotionControllerSL1(MotionControllerBase):
         self.fans_error_changed = Signal()
         self.statistics_changed = Signal()
 
+        # pylint: disable=no-member
+        self._state_updates = (
+            (1 << StatusBits.TOWER.value, self.tower_status_changed, None),
+            (1 << StatusBits.TILT.value, self.tilt_status_changed, None),
+            (1 << StatusBits.BUTTON.value, self.power_button_changed, None),
+            (1 << StatusBits.COVER.value, self.cover_state_changed, None),
+            (1 << StatusBits.FANS.value, self.fans_error_changed, self.get_fans_error),
+        )
+
         self.power_button_changed.connect(self._power_button_handler)
         self.cover_state_changed.connect(self._cover_state_handler)
 
-        self._fans_mask = {0: False, 1: False, 2: False}
-        self._fans_rpm = {0: defines.fanMinRPM, 1: defines.fanMinRPM, 2: defines.fanMinRPM}
+        self._fans_mask: List[bool] = [False, False, False]
+        self._fans_rpm: List[int] = [defines.fanMinRPM] * 3
 
         # pylint: disable=no-member
         self._u_input = UInput(
@@ -164,6 +175,7 @@ class MotionControllerSL1(MotionControllerBase):
             if self._flash_lock.acquire(blocking=False):  # pylint: disable = consider-using-with
                 try:
                     self._read_garbage()
+                    self._state_bits_cache = None
                     self.trace.append_trace(LineTrace(LineMarker.RESET, b"Motion controller soft reset"))
                     self.write_port("!rst\n".encode("ascii"))
                     self._ensure_ready(after_soft_reset=True)
@@ -229,6 +241,7 @@ class MotionControllerSL1(MotionControllerBase):
         Assumes portLock is already acquired
         """
         self.logger.info("Doing hard reset of the motion controller")
+        self._state_bits_cache = None
         self.trace.append_trace(LineTrace(LineMarker.RESET, b"Motion controller hard reset"))
         rst = find_line("mc-reset")
         if not rst:
@@ -248,9 +261,15 @@ class MotionControllerSL1(MotionControllerBase):
             # pylint: disable = no-member
             request = StatusBits.__members__.keys()  # type: ignore
 
-        bits = self.doGetBoolList("?", bit_count=16)
-        if len(bits) != 16:
-            raise ValueError(f"State bits count not match! ({bits})")
+        cache = self._state_bits_cache
+        if not check_for_updates and cache and monotonic() - cache[0] < self.STATE_BITS_CACHE_TTL_S:
+            # Burst of queries, share the recent result instead of another round-trip to the MC
+            bits = cache[1]
+        else:
+            bits = self.doGetBoolList("?", bit_count=16)
+            if len(bits) != 16:
+                raise ValueError(f"State bits count not match! ({bits})")
+            self._state_bits_cache = (monotonic(), bits)
 
         if check_for_updates:
             self._handle_updates(bits)
@@ -264,23 +283,16 @@ class MotionControllerSL1(MotionControllerBase):
         return state[name]
 
     def _handle_updates(self, state_bits: List[bool]):
-        # pylint: disable=no-member
-        tower_idx = StatusBits.TOWER.value
-        if not self._old_state_bits or state_bits[tower_idx] != self._old_state_bits[tower_idx]:
-            self.tower_status_changed.emit(state_bits[tower_idx])
-        tilt_idx = StatusBits.TILT.value
-        if not self._old_state_bits or state_bits[tilt_idx] != self._old_state_bits[tilt_idx]:
-            self.tilt_status_changed.emit(state_bits[tilt_idx])
-        power_idx = StatusBits.BUTTON.value
-        if not self._old_state_bits or state_bits[power_idx] != self._old_state_bits[power_idx]:
-            self.power_button_changed.emit(state_bits[power_idx])
-        cover_idx = StatusBits.COVER.value
-        if not self._old_state_bits or state_bits[cover_idx] != self._old_state_bits[cover_idx]:
-            self.cover_state_changed.emit(state_bits[cover_idx])
-        fans_ids = StatusBits.FANS.value
-        if not self._old_state_bits or state_bits[fans_ids] != self._old_state_bits[fans_ids]:
-            self.fans_error_changed.emit(self.get_fans_error())
-        self._old_state_bits = state_bits
+        state = 0
+        for idx, bit in enumerate(state_bits):
+            if bit:
+                state |= 1 << idx
+        changed = state ^ self._old_state
+        if changed:
+            for mask, signal, getter in self._state_updates:
+                if changed & mask:
+                    signal.emit(getter() if getter else bool(state & mask))
+        self._old_state = state
 
     def _power_button_handler(self, state: bool):
         # pylint: disable=no-member
@@ -296,11 +308,11 @@ class MotionControllerSL1(MotionControllerBase):
         return self.doGetIntList("?rev")
 
     def _get_temperatures(self):
-        temps = self.doGetIntList("?temp", multiply=0.1)
+        temps = self.doGetIntList("?temp")  # [dK]
         if len(temps) != 4:
             raise ValueError(f"TEMPs count not match! ({temps})")
 
-        return [round(temp, 1) for temp in temps]
+        return [temp / 10 for temp in temps]
 
     def _value_refresh_body(self):
         self.logger.info("Value refresh thread running")
@@ -330,11 +342,11 @@ class MotionControllerSL1(MotionControllerBase):
 
     def set_fan_running(self, index: int, run: bool):
         self._fans_mask[index] = run
-        self.doSetBoolList("!fans", self._fans_mask.values())
+        self.doSetBoolList("!fans", self._fans_mask)
 
     def set_fan_rpm(self, index: int, rpm: int):
         self._fans_rpm[index] = rpm
-        self.do("!frpm", " ".join([str(v) for v in self._fans_rpm.values()]))
+        self.do("!frpm", " ".join(map(str, self._fans_rpm)))
 
     def _get_fans_rpm(self) -> Tuple[int, int, int]:
         rpms = self.doGetIntList("?frpm", multiply=1)
@@ -350,17 +362,25 @@ class MotionControllerSL1(MotionControllerBase):
 
         return data
 
-    @safe_call(False, (MotionControllerException, ValueError))
     def get_fan_running(self, index: int):
-        return self.get_fans_bits("?fans", (index,))[index]
+        # Polled frequently, error handling is inlined instead of using safe_call to spare a wrapper frame
+        try:
+            return self.get_fans_bits("?fans", (index,))[index]
+        except (MotionControllerException, ValueError):
+            self.logger.exception("Call to get_fan_running failed, returning safe default")
+            return False
 
-    @safe_call({0: True, 1: True, 2: True}, (MotionControllerException, ValueError))
     def get_fans_error(self, check_for_updates=False):
-        state = self.getStateBits(["fans"], check_for_updates)
-        if "fans" not in state:
-            raise ValueError(f"'fans' not in state: {state}")
-
-        return self.get_fans_bits("?fane", (0, 1, 2))
+        # Polled frequently, error handling is inlined instead of using safe_call to spare a wrapper frame
+        try:
+            state = self.getStateBits(["fans"], check_for_updates)
+            if "fans" not in state:
+                raise ValueError(f"'fans' not in state: {state}")
+
+            return self.get_fans_bits("?fane", (0, 1, 2))
+        except (MotionControllerException, ValueError):
+            self.logger.exception("Call to get_fans_error failed, returning safe default")
+            return {0: True, 1: True, 2: True}
 
     def get_fans_bits(self, cmd, request):
         bits = self.doGetBoolList(cmd, bit_count=3)
@@ -8,10 +8,11 @@
 
 import logging
 import weakref
-from queue import Queue
-from typing import Optional, Any
+from collections import deque
+from typing import Optional, Any, Deque, Tuple
 from PySignal import Signal
 from pydbus import SystemBus
+from pydbus.generic import signal
 
 from slafw import defines
 from slafw.api.exposure0 import Exposure0
@@ -22,6 +23,20 @@ from slafw.states.wizard import WizardState
 from slafw.wizard.wizard import Wizard
 
 
+def _release_signal_maps(api_object: Any) -> None:
+    """
+    Drop pydbus signal bindings of a DBus API object
+
+    Each pydbus signal keeps a map of bound signals keyed by the API object. The bound signal references the object
+    back, so neither weak references nor finalizers can release it. The map entries hold strong references preventing
+    release of the API object (and the wrapped exposure/wizard) from RAM.
+    """
+    # TODO: it is not nice to touch pydbus signal internals, we would better fix the library
+    for attribute in vars(type(api_object)).values():
+        if isinstance(attribute, signal):
+            attribute.map.pop(api_object, None)
+
+
 class ActionManager:
     MAX_EXPOSURES = 3
 
@@ -29,16 +44,19 @@ class ActionManager:
         self.logger = logging.getLogger(__name__)
         self._current_exposure: Optional[Exposure] = None
         self._current_exposure_change_registration = None
-        self._exposure_dbus_objects = Queue()
+        self._current_exposure_path: Optional[str] = None
+        self._exposure_dbus_objects: Deque[Tuple[Exposure0, Any]] = deque()
         self._system_bus = SystemBus()
         self.exposure_changed = Signal()
         self.exposure_data_changed = Signal()
         self.wizard_state_changed = Signal()
-        self._exposure_bus_name = None
+        self.wizard_started = Signal()
         self._wizard: Optional[Wizard] = None
         self._wizard_registration = None
         self._wizard_registered_object = None
-        self._wizard_dbus_name = None
+        # Own the bus names up front, registering an exposure or a wizard then only publishes the object
+        self._exposure_bus_name = self._system_bus.request_name(Exposure0.__INTERFACE__)
+        self._wizard_dbus_name = self._system_bus.request_name(Wizard0.__INTERFACE__)
         self._exited = False
 
     def new_exposure(self, exposure_pickler: ExposurePickler, project_path: str) -> Exposure:
@@ -76,13 +94,15 @@ class ActionManager:
         return exposure
 
     def _get_job_id(self) -> int:
-        try:
-            with defines.last_job.open("r") as f:
+        # Read and update the last job id using a single file descriptor, "a+" creates the file if missing
+        with open(defines.last_job, "a+", encoding="utf-8") as f:
+            f.seek(0)
+            try:
                 job_id = int(f.read()) + 1
-        except (ValueError, FileNotFoundError):
-            self.logger.info("Failed to load last exposure id, starting from 0")
-            job_id = 0
-        with defines.last_job.open("w") as f:
+            except ValueError:
+                self.logger.info("Failed to load last exposure id, starting from 0")
+                job_id = 0
+            f.truncate(0)
             f.write(str(job_id))
         return job_id
 
@@ -90,6 +110,7 @@ class ActionManager:
         if self._current_exposure:
             self._current_exposure.data.changed.disconnect(self._on_exposure_data_changed)
         self._current_exposure = exposure
+        self._current_exposure_path = exposure.project.data.path
         self._current_exposure.data.changed.connect(self._on_exposure_data_changed)
         self._register_exposure(exposure)
         self.exposure_changed.emit()
@@ -101,32 +122,24 @@ class ActionManager:
         :param exposure: Exposure to register
         :return: Registered path
         """
-        # Register bus name if not already registered
-        if not self._exposure_bus_name:
-            self._exposure_bus_name = self._system_bus.request_name(Exposure0.__INTERFACE__)
-
+        bus = self._system_bus
         path = Exposure0.dbus_path(exposure.data.instance_id)
         exposure0 = Exposure0(exposure)
         weak_exposure0 = weakref.proxy(exposure0)
         # pylint: disable=no-member
-        registration = self._system_bus.register_object(path, weak_exposure0, exposure0.dbus)  # type: ignore
-        self._exposure_dbus_objects.put((exposure0, registration))
+        registration = bus.register_object(path, weak_exposure0, exposure0.dbus)  # type: ignore
+        self._exposure_dbus_objects.append((exposure0, registration))
         self.logger.info("New exposure registered as: %s", path)
         # Maintain history of exposure registrations
         self._shrink_exposures_to(self.MAX_EXPOSURES)
 
     def _shrink_exposures_to(self, limit: int):
-        while self._exposure_dbus_objects.qsize() > limit:
-            exposure0, registration = self._exposure_dbus_objects.get()
+        exposure_dbus_objects = self._exposure_dbus_objects
+        while len(exposure_dbus_objects) > limit:
+            exposure0, registration = exposure_dbus_objects.popleft()
             exposure0.about_to_be_deleted()  # Notify clients
             registration.unregister()
-            # TODO: it is not nice to touch pydbus signal internals, we would better fix the library
-            # The map holds strong reference to the Exposure0 preventing release of the exposure from RAM.
-            del Exposure0.PropertiesChanged.map[exposure0]
-            # pylint: disable=no-member
-            # type: ignore[attr-defined]
-            del Exposure0.exception.map[exposure0]
-            del Exposure0.about_to_be_deleted.map[exposure0]
+            _release_signal_maps(exposure0)
 
     @property
     def exposure(self) -> Optional[Exposure]:
@@ -147,8 +160,6 @@ class ActionManager:
 
         # The request_name and register object can be replaced by simpler publish, but publish keeps reference to
         # API object internals preventing it from gargabe collection
-        if not self._wizard_dbus_name:
-            self._wizard_dbus_name = self._system_bus.request_name(Wizard0.__INTERFACE__)
         self._wizard_registered_object = Wizard0(weakref.proxy(self._wizard))
         weak_wizard0 = weakref.proxy(self._wizard_registered_object)
         # pylint: disable=no-member
@@ -157,14 +168,13 @@ class ActionManager:
         )
 
         self._wizard.start()
+        self.wizard_started.emit()
         return self._wizard
 
     def _unregister_wizard(self):
         if self._wizard_registration:
             self._wizard_registration.unregister()
-            # TODO: it is not nice to touch pydbus signal internals, we would better fix the library
-            # The map holds strong reference to the Wizard0 instance preventing release of the wizard from RAM.
-            del Wizard0.PropertiesChanged.map[self._wizard_registered_object]
+            _release_signal_maps(self._wizard_registered_object)
             self._wizard_registration = None
             self._wizard_registered_object = None
         self._wizard = None
@@ -180,16 +190,15 @@ class ActionManager:
             self._wizard.force_cancel()
 
         self._shrink_exposures_to(0)
-        if self._exposure_bus_name:
-            self._exposure_bus_name.unown()
+        self._exposure_bus_name.unown()
         self._unregister_wizard()
-        if self._wizard_dbus_name:
-            self._wizard_dbus_name.unown()
+        self._wizard_dbus_name.unown()
         if self._current_exposure_change_registration:
             self._current_exposure_change_registration.unsubscribe()
 
         # Throw away reference to let exposure garbage collect
         self._current_exposure = None
+        self._current_exposure_path = None
 
     def _on_exposure_data_changed(self, key: str, value: Any):
         self.logger.debug("on_exposure_data_changed: %s set to %s", key, value)
@@ -207,6 +216,9 @@ class ActionManager:
         :return: None
         raise NotAvailableInState
         """
+        current_path = self._current_exposure_path
+        if current_path is None or path != current_path:
+            return
         exposure = self.exposure
-        if exposure and not exposure.canceled and path == exposure.project.data.path:
+        if exposure and not exposure.canceled:
             exposure.try_cancel()
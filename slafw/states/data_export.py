@@ -2,7 +2,10 @@
 # Copyright (C) 2020-2022 Prusa Research a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from __future__ import annotations
+
 from enum import Enum
+from typing import FrozenSet
 
 
 class ExportState(Enum):
@@ -14,8 +17,11 @@ class ExportState(Enum):
     CANCELED = 5
 
     @staticmethod
-    def finished_states():
-        return {ExportState.FINISHED, ExportState.CANCELED, ExportState.FAILED}
+    def finished_states() -> FrozenSet[ExportState]:
+        return _FINISHED_STATES
+
+
+_FINISHED_STATES = frozenset((ExportState.FINISHED, ExportState.CANCELED, ExportState.FAILED))
 
 
 class StoreType(Enum):
@@ -2,7 +2,10 @@
 # Copyright (C) 2020 Prusa Research a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from __future__ import annotations
+
 from enum import unique, Enum
+from typing import FrozenSet
 
 
 @unique
@@ -16,5 +19,8 @@ class ExamplesState(Enum):
     FAILURE = 6
 
     @staticmethod
-    def get_finished():
-        return [ExamplesState.COMPLETED, ExamplesState.FAILURE]
+    def get_finished() -> FrozenSet[ExamplesState]:
+        return _FINISHED_STATES
+
+
+_FINISHED_STATES = frozenset((ExamplesState.COMPLETED, ExamplesState.FAILURE))
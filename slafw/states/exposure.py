@@ -3,7 +3,10 @@
 # Copyright (C) 2018-2020 Prusa Research s.r.o. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from __future__ import annotations
+
 from enum import unique, Enum
+from typing import FrozenSet
 
 
 @unique
@@ -33,19 +36,26 @@ class ExposureState(Enum):
     HOMING_AXIS = 30
 
     @staticmethod
-    def finished_states():
-        return [ExposureState.FAILURE, ExposureState.CANCELED, ExposureState.FINISHED, ExposureState.DONE]
+    def finished_states() -> FrozenSet[ExposureState]:
+        return _FINISHED_STATES
 
     @staticmethod
-    def cancelable_states():
-        cancelable_states = ExposureState.finished_states()
-        cancelable_states.extend((
-            ExposureState.CONFIRM,
-            ExposureState.CHECKS,
-            ExposureState.POUR_IN_RESIN,
-            ExposureState.HOMING_AXIS
-        ))
-        return cancelable_states
+    def cancelable_states() -> FrozenSet[ExposureState]:
+        return _CANCELABLE_STATES
+
+
+_FINISHED_STATES = frozenset((
+    ExposureState.FAILURE,
+    ExposureState.CANCELED,
+    ExposureState.FINISHED,
+    ExposureState.DONE
+))
+_CANCELABLE_STATES = _FINISHED_STATES | frozenset((
+    ExposureState.CONFIRM,
+    ExposureState.CHECKS,
+    ExposureState.POUR_IN_RESIN,
+    ExposureState.HOMING_AXIS
+))
 
 
 @unique
@@ -6,7 +6,8 @@
 from __future__ import annotations
 
 from enum import unique, Enum
-from typing import Iterable
+from operator import attrgetter
+from typing import Dict, Iterable
 
 
 @unique
@@ -42,22 +43,26 @@ class PrinterState(Enum):
     OVERHEATED = 9
 
     def to_state0(self) -> Printer0State:
-        return {
-            self.INIT: Printer0State.INITIALIZING,
-            self.RUNNING: Printer0State.IDLE,
-            self.EXCEPTION: Printer0State.EXCEPTION,
-            self.UPDATING: Printer0State.UPDATE,
-            self.PRINTING: Printer0State.PRINTING,
-            self.WIZARD: Printer0State.WIZARD,
-            self.UPDATING_MC: Printer0State.UPDATE_MC,
-            self.ADMIN: Printer0State.ADMIN,
-            self.OVERHEATED: Printer0State.OVERHEATED,
-        }.get(self, None)  # type: ignore
+        """
+        Map to the state exposed on DBus. Hot paths can look up STATE0_MAP directly.
+        """
+        return STATE0_MAP.get(self)  # type: ignore
 
     @staticmethod
     def get_most_important(states: Iterable[PrinterState]) -> PrinterState:
-        if not states:
-            return PrinterState.RUNNING
+        return max(states, key=_STATE_VALUE, default=PrinterState.RUNNING)
 
-        s = sorted(states, key=lambda state: state.value)[-1]
-        return s
+
+_STATE_VALUE = attrgetter("value")
+
+STATE0_MAP: Dict[PrinterState, Printer0State] = {
+    PrinterState.INIT: Printer0State.INITIALIZING,
+    PrinterState.RUNNING: Printer0State.IDLE,
+    PrinterState.EXCEPTION: Printer0State.EXCEPTION,
+    PrinterState.UPDATING: Printer0State.UPDATE,
+    PrinterState.PRINTING: Printer0State.PRINTING,
+    PrinterState.WIZARD: Printer0State.WIZARD,
+    PrinterState.UPDATING_MC: Printer0State.UPDATE_MC,
+    PrinterState.ADMIN: Printer0State.ADMIN,
+    PrinterState.OVERHEATED: Printer0State.OVERHEATED,
+}
@@ -2,7 +2,10 @@
 # Copyright (C) 2020-2024 Prusa Research a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from __future__ import annotations
+
 from enum import unique, Enum
+from typing import FrozenSet
 
 
 @unique
@@ -54,8 +57,11 @@ class WizardState(Enum):
     TANK_SURFACE_CLEANER_REMOVE_CLEANING_ADAPTOR = 2502
 
     @staticmethod
-    def finished_states():
-        return [WizardState.FAILED, WizardState.DONE, WizardState.CANCELED]
+    def finished_states() -> FrozenSet[WizardState]:
+        return _FINISHED_STATES
+
+
+_FINISHED_STATES = frozenset((WizardState.FAILED, WizardState.DONE, WizardState.CANCELED))
 
 
 @unique
@@ -8,13 +8,12 @@ Runtime test data
 Used to share information among different mock objects and production code
 """
 
-from datetime import datetime
 from typing import Optional
 
 testing = False
 test_uvmeter_present = True
 injected_preprint_warning = None
 uv_pwm = 0
-uv_on_until: Optional[datetime] = None
+uv_on_until: Optional[int] = None  # UV LED on deadline, time.monotonic_ns() value
 exposure_image = None
 uv_error_each = 0
@@ -11,11 +11,13 @@ import tempfile
 import threading
 import warnings
 import weakref
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
 from types import FrameType
 from typing import List
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
 import pydbus
 from PIL import Image, ImageChops
@@ -49,6 +51,7 @@ from slafw.hardware.sl1.tilt_profiles import TILT_CFG_LOCAL
 from slafw.hardware.sl1.tower_profiles import TOWER_CFG_LOCAL
 
 
+@lru_cache(maxsize=1)
 def get_printer_model():
     try:
         return PrinterModel()
@@ -66,6 +69,20 @@ class SlafwTestCase(TestCase):
     DATA_DIR = Path(defines.dataPath)
     EEPROM_FILE = Path.cwd() / "EEPROM.dat"
 
+    # Patches that do not depend on the per-test temporary directory, (target, new) pairs
+    STATIC_PATCH_TARGETS = (
+        ("slafw.motion_controller.sl1_controller.chip", DEFAULT),
+        ("slafw.motion_controller.sl1_controller.find_line", DEFAULT),
+        ("slafw.motion_controller.sl1_controller.line_request", DEFAULT),
+        ("slafw.motion_controller.sl1_controller.UInput", DEFAULT),
+        ("slafw.motion_controller.base_controller.serial", mc_port),
+        ("slafw.libUvLedMeterMulti.serial.tools.list_ports", DEFAULT),
+        ("slafw.hardware.sl1.hardware.Booster", slafw.tests.mocks.sl1s_uvled_booster.BoosterMock),
+        ("slafw.defines.emmc_serial_path", SAMPLES_DIR / "cid"),
+        ("slafw.defines.cpuSNFile", SAMPLES_DIR / "nvmem"),
+        ("slafw.hardware.a64.temp_sensor.A64CPUTempSensor.CPU_TEMP_PATH", SAMPLES_DIR / "cputemp"),
+    )
+
     def setUp(self) -> None:
         # gitlab CI job creates model folder in different location due to restricted permissions in Docker container
         # common path is /builds/project-0/model
@@ -78,17 +95,16 @@ class SlafwTestCase(TestCase):
         self.temp_dir_project = tempfile.TemporaryDirectory()  # pylint: disable = consider-using-with
         self.TEMP_DIR = Path(self.temp_dir_obj.name)
 
-        self.__base_patches = self.patches()
-
-        for p in self.__base_patches:
-            p.start()
+        self.__patch_stack = ExitStack()
+        for p in self.patches():
+            self.__patch_stack.enter_context(p)
 
         # Set stream handler here in order to use stdout already captured by unittest
         self.stream_handler = logging.StreamHandler(sys.stdout)
         self.stream_handler.name = self.LOGGER_STREAM_HANDLER_NAME
         self.stream_handler.setFormatter(logging.Formatter(self.LOGGER_FORMAT))
         logger = logging.getLogger()
-        if any([handler.name == self.LOGGER_STREAM_HANDLER_NAME for handler in logger.handlers]):
+        if any(handler.name == self.LOGGER_STREAM_HANDLER_NAME for handler in logger.handlers):
             raise RuntimeError("Handler already installed !!! Failed to run super().tearDown in previous test ???")
         logger.handlers.clear()  # remove handlers which might be present from imported modules. For example gpio.py
         logger.addHandler(self.stream_handler)
@@ -100,44 +116,38 @@ class SlafwTestCase(TestCase):
         set_configured_printer_model(get_printer_model())   # Do not run UpgradeWizard by default)
 
     def patches(self) -> List[patch]:
-        wizard_history_path = self.TEMP_DIR / "wizard_history" / "user_data"
-        wizard_history_path.mkdir(exist_ok=True, parents=True)
-        factory_enable_path = self.TEMP_DIR / "factory_mode_enabled"
-        factory_enable_path.touch()
-
-        return [
-            patch("slafw.motion_controller.sl1_controller.chip"),
-            patch("slafw.motion_controller.sl1_controller.find_line"),
-            patch("slafw.motion_controller.sl1_controller.line_request"),
-            patch("slafw.motion_controller.sl1_controller.UInput"),
-            patch("slafw.motion_controller.base_controller.serial", mc_port),
-            patch("slafw.libUvLedMeterMulti.serial.tools.list_ports"),
+        # Join plain strings, only the final values are turned into Path objects
+        temp_dir = self.temp_dir_obj.name
+
+        def temp_path(*parts: str) -> Path:
+            return Path(os.path.join(temp_dir, *parts))
+
+        # Wizard history directory is created on demand by the code writing the history
+        factory_enable_path = temp_path("factory_mode_enabled")
+        factory_enable_path.touch()  # Tests run in factory mode by default
+
+        return [patch(target, new) for target, new in self.STATIC_PATCH_TARGETS] + [
             patch("slafw.hardware.exposure_screen.Wayland", Mock()),
-            patch("slafw.hardware.sl1.hardware.Booster", slafw.tests.mocks.sl1s_uvled_booster.BoosterMock),
-            patch("slafw.hardware.sl1.tilt.TILT_CFG_LOCAL", self.TEMP_DIR / TILT_CFG_LOCAL.name),
-            patch("slafw.hardware.sl1.tower.TOWER_CFG_LOCAL", self.TEMP_DIR / TOWER_CFG_LOCAL.name),
-            patch("slafw.tests.mocks.axis.TILT_CFG_LOCAL", self.TEMP_DIR / TILT_CFG_LOCAL.name),
-            patch("slafw.tests.mocks.axis.TOWER_CFG_LOCAL", self.TEMP_DIR / TOWER_CFG_LOCAL.name),
-            patch("slafw.exposure.persistence.LAST_PROJECT_DATA", self.TEMP_DIR / LAST_PROJECT_DATA.name),
-            patch("slafw.defines.ramdiskPath", str(self.TEMP_DIR)),
-            patch("slafw.defines.previousPrints", self.TEMP_DIR),
-            patch("slafw.defines.statsData", self.TEMP_DIR / "stats.toml"),
-            patch("slafw.defines.emmc_serial_path", self.SAMPLES_DIR / "cid"),
-            patch("slafw.defines.wizardHistoryPath", wizard_history_path),
-            patch("slafw.defines.wizardHistoryPathFactory", self.TEMP_DIR / "wizard_history" / "factory_data"),
+            patch("slafw.hardware.sl1.tilt.TILT_CFG_LOCAL", temp_path(TILT_CFG_LOCAL.name)),
+            patch("slafw.hardware.sl1.tower.TOWER_CFG_LOCAL", temp_path(TOWER_CFG_LOCAL.name)),
+            patch("slafw.tests.mocks.axis.TILT_CFG_LOCAL", temp_path(TILT_CFG_LOCAL.name)),
+            patch("slafw.tests.mocks.axis.TOWER_CFG_LOCAL", temp_path(TOWER_CFG_LOCAL.name)),
+            patch("slafw.exposure.persistence.LAST_PROJECT_DATA", temp_path(LAST_PROJECT_DATA.name)),
+            patch("slafw.defines.ramdiskPath", temp_dir),
+            patch("slafw.defines.statsData", temp_path("stats.toml")),
+            patch("slafw.defines.wizardHistoryPath", temp_path("wizard_history", "user_data")),
+            patch("slafw.defines.wizardHistoryPathFactory", temp_path("wizard_history", "factory_data")),
             patch("slafw.defines.factoryMountPoint", self.TEMP_DIR),
             patch("slafw.defines.configDir", self.TEMP_DIR),
-            patch("slafw.defines.hwConfigPath", self.TEMP_DIR / "hwconfig.toml"),
-            patch("slafw.defines.hwConfigPathFactory", self.TEMP_DIR / "hwconfig-factory.toml"),
-            patch("slafw.defines.printer_model", self.TEMP_DIR / "model"),
-            patch("slafw.defines.firstboot", self.TEMP_DIR / "firstboot"),
-            patch("slafw.defines.expoPanelLogPath", self.TEMP_DIR / defines.expoPanelLogFileName),
+            patch("slafw.defines.hwConfigPath", temp_path("hwconfig.toml")),
+            patch("slafw.defines.hwConfigPathFactory", temp_path("hwconfig-factory.toml")),
+            patch("slafw.defines.printer_model", temp_path("model")),
+            patch("slafw.defines.firstboot", temp_path("firstboot")),
+            patch("slafw.defines.expoPanelLogPath", temp_path(defines.expoPanelLogFileName)),
             patch("slafw.defines.factory_enable", factory_enable_path),
             patch("slafw.defines.exposure_panel_of_node", self.SAMPLES_DIR / "of_node" / get_printer_model().name.lower()),
-            patch("slafw.defines.cpuSNFile", self.SAMPLES_DIR / "nvmem"),
             patch("slafw.defines.previousPrints", Path(self.temp_dir_project.name)),
-            patch("slafw.defines.last_job", self.TEMP_DIR / "last_job"),
-            patch("slafw.hardware.a64.temp_sensor.A64CPUTempSensor.CPU_TEMP_PATH", self.SAMPLES_DIR / "cputemp"),
+            patch("slafw.defines.last_job", temp_path("last_job")),
             patch("slafw.functions.system.os", Mock()),
         ]
 
@@ -159,46 +169,51 @@ class SlafwTestCase(TestCase):
         self.temp_dir_project.cleanup()
         self.temp_dir_obj.cleanup()
 
-        for p in self.__base_patches:
-            p.stop()
+        self.__patch_stack.close()
 
         super().tearDown()
 
 
 class RefCheckTestCase(TestCase):
+    TRACKED_TYPES = (Printer0, Printer, Exposure0, Exposure, Wizard0, Wizard, ExposureImage)
+
     def tearDown(self) -> None:
         gc.collect()
-        self.ref_check_type(Printer0)
-        self.ref_check_type(Printer)
-        self.ref_check_type(Exposure0)
-        self.ref_check_type(Exposure)
-        self.ref_check_type(Wizard0)
-        self.ref_check_type(Wizard)
-        self.ref_check_type(ExposureImage)
-
-        super().tearDown()
-
-    def ref_check_type(self, t: type):
-        instances = 0
+        instances = dict.fromkeys(self.TRACKED_TYPES, 0)
+        report: List[str] = []
+        # Single walk over all objects, checking all tracked types at once
         for obj in gc.get_objects():
             try:
-                if isinstance(obj, (weakref.ProxyTypes, Mock)):
+                if isinstance(obj, (weakref.ProxyTypes, Mock)) or not isinstance(obj, self.TRACKED_TYPES):
                     continue
-                if isinstance(obj, t):
-                    print(f"Referrers to {t}:")
-                    for num, ref in enumerate(gc.get_referrers(obj)):
-                        # do NOT count "global" and "class 'frame'" referrers
-                        if isinstance(ref, FrameType):
-                            print(f"Not counted 'frame' referrer {num}: {ref}")
-                        elif isinstance(ref, list) and len(ref) > 100:
-                            print(f"Not counted 'global' referrer {num}: <100+ LONG LIST>")
-                        else:
-                            instances += 1
-                            print(f"Referrer {num}: {ref} - {type(ref)}")
+                referrers = self._count_referrers(obj, report)
+                for t in self.TRACKED_TYPES:
+                    if isinstance(obj, t):
+                        instances[t] += referrers
             except ReferenceError:
                 # Weak reference no longer valid
                 pass
-        self.assertEqual(0, instances, f"Found {instances} of {t} left behind by test run")
+
+        leftovers = [f"Found {count} of {t} left behind by test run" for t, count in instances.items() if count]
+        if leftovers:
+            self.fail("\n".join(leftovers + report))
+
+        super().tearDown()
+
+    @staticmethod
+    def _count_referrers(obj: object, report: List[str]) -> int:
+        report.append(f"Referrers to {type(obj)}:")
+        instances = 0
+        for num, ref in enumerate(gc.get_referrers(obj)):
+            # do NOT count "global" and "class 'frame'" referrers
+            if isinstance(ref, FrameType):
+                report.append(f"Not counted 'frame' referrer {num}: {ref}")
+            elif isinstance(ref, list) and len(ref) > 100:
+                report.append(f"Not counted 'global' referrer {num}: <100+ LONG LIST>")
+            else:
+                instances += 1
+                report.append(f"Referrer {num}: {ref} - {type(ref)}")
+        return instances
 
 
 class SlafwTestCaseDBus(SlafwTestCase, DBusTestCase):
@@ -206,19 +221,60 @@ class SlafwTestCaseDBus(SlafwTestCase, DBusTestCase):
     dbus_mocks = []
     event_loop = GLib.MainLoop()
     event_thread: threading.Thread = None
+    network_manager: NetworkManager
+    hostname: Hostname
+    locale: Locale
+    time_date: TimeDate
+    systemd: Systemd
+    rauc: Rauc
+    file_manager: FileManager0
+    system_bus: pydbus.bus.Bus
 
     @classmethod
     def setUpClass(cls):
         DBusTestCase.setUpClass()
-        if not cls.dbus_started:
+        # One private system bus daemon per test process. The flag is stored on this class, not on the subclass
+        # being set up, so that later test classes reuse the daemon the GDBus system bus singleton is connected to.
+        if not SlafwTestCaseDBus.dbus_started:
             cls.start_system_bus()
-            cls.dbus_started = True
+            SlafwTestCaseDBus.dbus_started = True
 
         cls.event_thread = threading.Thread(target=cls.event_loop.run)
         cls.event_thread.start()
 
+        # DBus mocks are published once per class, their state is reset before each test
+        # Shared connection wrapper, tests look up proxies through it instead of resolving the bus again
+        cls.system_bus = bus = pydbus.SystemBus()
+        cls.network_manager = NetworkManager()
+        cls.hostname = Hostname()
+        cls.locale = Locale()
+        cls.time_date = TimeDate()
+        cls.systemd = Systemd()
+        cls.rauc = Rauc()
+        cls.file_manager = FileManager0()
+        cls.dbus_mocks = [
+            bus.publish(
+                NetworkManager.__INTERFACE__,
+                cls.network_manager,
+                ("Settings", cls.network_manager),
+                ("ethernet", cls.network_manager),
+                ("wifi0", cls.network_manager),
+                ("wifi1", cls.network_manager),
+            ),
+            bus.publish(FileManager0.__INTERFACE__, cls.file_manager),
+            bus.publish(Hostname.__INTERFACE__, cls.hostname),
+            bus.publish(Rauc.__OBJECT__, ("/", cls.rauc)),
+            bus.publish(Locale.__INTERFACE__, cls.locale),
+            bus.publish(TimeDate.__INTERFACE__, cls.time_date),
+            bus.publish(Systemd.__INTERFACE__, cls.systemd)
+        ]
+
     @classmethod
     def tearDownClass(cls):
+        for dbus_mock in cls.dbus_mocks:
+            dbus_mock.unpublish()
+        cls.dbus_mocks = []
+
         cls.event_loop.quit()
         cls.event_thread.join()
         # TODO: Would be nice to properly terminate fake dbus bus and start new one next time
@@ -228,32 +284,13 @@ class SlafwTestCaseDBus(SlafwTestCase, DBusTestCase):
     def setUp(self) -> None:
         super().setUp()
 
-        # DBus mocks
-        nm = NetworkManager()
-        bus = pydbus.SystemBus()
-        self.hostname = Hostname()
-        self.locale = Locale()
-        self.time_date = TimeDate()
-        self.systemd = Systemd()
-        self.dbus_mocks = [
-            bus.publish(
-                NetworkManager.__INTERFACE__,
-                nm,
-                ("Settings", nm),
-                ("ethernet", nm),
-                ("wifi0", nm),
-                ("wifi1", nm),
-            ),
-            bus.publish(FileManager0.__INTERFACE__, FileManager0()),
-            bus.publish(Hostname.__INTERFACE__, self.hostname),
-            bus.publish(Rauc.__OBJECT__, ("/", Rauc())),
-            bus.publish(Locale.__INTERFACE__, self.locale),
-            bus.publish(TimeDate.__INTERFACE__, self.time_date),
-            bus.publish(Systemd.__INTERFACE__, self.systemd)
-        ]
-
-    def tearDown(self) -> None:
-        for dbus_mock in self.dbus_mocks:
-            dbus_mock.unpublish()
-
-        super().tearDown()
+        for mock in (
+            self.network_manager,
+            self.hostname,
+            self.locale,
+            self.time_date,
+            self.systemd,
+            self.rauc,
+            self.file_manager,
+        ):
+            mock.reset()
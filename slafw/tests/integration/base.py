@@ -14,8 +14,6 @@ from threading import Thread
 from typing import Optional, List
 from unittest.mock import patch
 
-from pydbus import SystemBus
-
 from slafw import defines, test_runtime
 from slafw.api.printer0 import Printer0
 from slafw.libPrinter import Printer
@@ -24,6 +22,13 @@ from slafw.states.printer import PrinterState
 
 
 class SlaFwIntegrationTestCaseBase(SlafwTestCaseDBus, RefCheckTestCase):
+    """
+    Integration test fixture
+
+    DBus mock services are published once per class by SlafwTestCaseDBus and reset before each test. The Printer
+    and its Printer0 API object are created per test, as their configuration lives in the per-test patched
+    temporary directory and RefCheckTestCase verifies they are released after every test.
+    """
     # pylint: disable = too-many-instance-attributes
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -47,8 +52,10 @@ class SlaFwIntegrationTestCaseBase(SlafwTestCaseDBus, RefCheckTestCase):
         self.try_start_printer()
 
         self._printer0 = Printer0(self.printer)
+        # In-process access for tests not exercising the bus itself, weak so it does not outlive tearDown
+        self.printer0_local = weakref.proxy(self._printer0)
         # pylint: disable = no-member
-        self.printer0_dbus = SystemBus().publish(
+        self.printer0_dbus = self.system_bus.publish(
             Printer0.__INTERFACE__,
             (None, weakref.proxy(self._printer0), self._printer0.dbus),
         )
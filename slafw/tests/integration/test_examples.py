@@ -5,7 +5,7 @@
 import os
 import unittest
 from tempfile import TemporaryDirectory
-from time import sleep
+from threading import Event
 from unittest.mock import patch
 
 import pydbus
@@ -33,10 +33,16 @@ class TestIntegrationExamples0(SlaFwIntegrationTestCaseBase):
                 dbus_path, "/cz/prusa3d/sl1/examples0", "Examples0 dbus path"
             )
             examples0 = pydbus.SystemBus().get(Examples0.__INTERFACE__)
-            for _ in range(100):
-                if ExamplesState(examples0.state) == ExamplesState.FAILURE:
-                    break
-                sleep(0.1)
+            finished = Event()
+
+            def on_properties_changed(_interface, changed, _invalidated):
+                if "state" in changed and ExamplesState(changed["state"]) in ExamplesState.get_finished():
+                    finished.set()
+
+            examples0.onPropertiesChanged = on_properties_changed
+            # The download might have finished before the handler was connected
+            if ExamplesState(examples0.state) not in ExamplesState.get_finished():
+                finished.wait(timeout=10)
             self.assertEqual(
                 ExamplesState.COMPLETED,
                 ExamplesState(examples0.state),
@@ -4,16 +4,15 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import gc
-import time
+import re
 import unittest
 import weakref
+from functools import wraps
 from pathlib import Path
-from time import sleep
-from typing import Type, List
+from threading import Event
+from typing import Dict, Type, List
 from unittest.mock import patch, Mock
 
-import pydbus
-
 from gi.repository.GLib import GError
 
 from slafw.api.exposure0 import Exposure0
@@ -27,12 +26,22 @@ from slafw.hardware.printer_model import PrinterModel
 from slafw.state_actions.manager import ActionManager
 from slafw.tests.integration.base import SlaFwIntegrationTestCaseBase
 
+_PROJECT_NAME_RE = re.compile(r".*\." + printer_model_regex())
 
 
 class TestIntegrationPrinter0(SlaFwIntegrationTestCaseBase):
     def setUp(self):
         super().setUp()
-        self.printer0: Printer0 = pydbus.SystemBus().get("cz.prusa3d.sl1.printer0")
+        # Call the Printer0 object directly, the DBus surface is covered by test_dbus_surface
+        self.printer0: Printer0 = self.printer0_local
+
+    def test_dbus_surface(self):
+        printer0: Printer0 = self.system_bus.get("cz.prusa3d.sl1.printer0")
+        self.assertEqual(Printer0State.IDLE.value, printer0.state)
+        self.assertEqual(printer0.serial_number, "CZPX0819X009XC00151")
+        self.assertEqual({"rpm": 0, "error": 0}, printer0.uv_led_fan)
+        printer0.tower_move(1)
+        printer0.tower_move(0)
 
     def test_initial_state(self):
         self.assertEqual(Printer0State.IDLE.value, self.printer0.state)
@@ -43,57 +52,32 @@ class TestIntegrationPrinter0(SlaFwIntegrationTestCaseBase):
         self.printer0.disable_motors()
 
     def test_control_moves(self):
-        self.printer0.tower_move(2)
-        sleep(0.1)
-        self.printer0.tower_move(0)
-        sleep(0.1)
-        self.printer0.tower_move(1)
-        sleep(0.1)
-        self.printer0.tower_move(0)
-        sleep(0.1)
-        self.printer0.tower_move(-1)
-        sleep(0.1)
-        self.printer0.tower_move(0)
-        sleep(0.1)
-        self.printer0.tower_move(-2)
-        sleep(0.1)
-        self.printer0.tower_move(0)
-
-        self.printer0.tilt_move(2)
-        sleep(0.1)
-        self.printer0.tilt_move(0)
-        sleep(0.1)
-        self.printer0.tilt_move(1)
-        sleep(0.1)
-        self.printer0.tilt_move(0)
-        sleep(0.1)
-        self.printer0.tilt_move(-1)
-        sleep(0.1)
-        self.printer0.tilt_move(0)
-        sleep(0.1)
-        self.printer0.tilt_move(-2)
-        sleep(0.1)
-        self.printer0.tilt_move(0)
+        for axis, move in (
+            (self.printer.hw.tower, self.printer0.tower_move),
+            (self.printer.hw.tilt, self.printer0.tilt_move),
+        ):
+            for speed in (2, 1, -1, -2):
+                with self.subTest(axis=axis.name, speed=speed):
+                    self.assertTrue(move(speed))
+                    # The stop has to interrupt a running move
+                    self.assertTrue(axis.moving)
+                    self.assertTrue(move(0))
+                    axis.wait_to_stop()
+                    self.assertFalse(axis.moving)
 
     def test_absolute_moves(self):
         self.printer0.tower_home()
         initial = self.printer0.tower_position_nm
         offset = 12500
         self.printer0.tower_position_nm += offset
-        for _ in range(1, 30):
-            sleep(0.1)
-            if self.printer0.tower_position_nm == initial + offset:
-                break
+        self.printer.hw.tower.wait_to_stop()
         self.assertAlmostEqual(self.printer0.tower_position_nm, initial + offset, 12500)
 
         self.printer0.tilt_home()
         initial = self.printer0.tilt_position
         offset = 12500
         self.printer0.tilt_position += offset
-        for _ in range(1, 30):
-            sleep(0.1)
-            if self.printer0.tilt_position == initial + offset:
-                break
+        self.printer.hw.tilt.wait_to_stop()
         self.assertAlmostEqual(self.printer0.tilt_position, initial + offset, 12500)
 
     def test_info_read(self):
@@ -154,8 +138,9 @@ class TestIntegrationPrinter0(SlaFwIntegrationTestCaseBase):
         project_list = self.printer0.list_projects_raw()
         self.assertTrue(project_list)
         for project in project_list:
-            self.assertTrue(Path(project).is_file())
-            self.assertRegex(Path(project).name, r".*\." + printer_model_regex())
+            path = Path(project)
+            self.assertTrue(path.is_file())
+            self.assertRegex(path.name, _PROJECT_NAME_RE)
 
     def test_print_start(self):
         # Fake calibration
@@ -174,20 +159,29 @@ class TestIntegrationPrinter0(SlaFwIntegrationTestCaseBase):
         self.printer.hw.config.calibrated = True
         self.printer.hw.config.showWizard = False
 
-        initial_exposure0 = self._get_num_instances(Exposure0)
-        initial_exposure = self._get_num_instances(Exposure)
+        instances = self._track_instances(Exposure0, Exposure)
 
         # Start and cancel more than max exposures -> force exposure gc
-        for _ in range(ActionManager.MAX_EXPOSURES + 1):
-            path = self.printer0.print(
-                    str(self.SAMPLES_DIR / ("numbers" + self.printer.hw.printer_model.extension)),
-                    False)
-            exposure0 = pydbus.SystemBus().get("cz.prusa3d.sl1.exposure0", path)
-            exposure0.cancel()
+        # Automatic collection is paused, the final count collects once
+        project = str(self.SAMPLES_DIR / ("numbers" + self.printer.hw.printer_model.extension))
+        gc.disable()
+        try:
+            for _ in range(ActionManager.MAX_EXPOSURES + 1):
+                self.printer0.print(project, False)
+                self.printer.action_manager.exposure.cancel()
+        finally:
+            gc.enable()
+
+        # The last exposure is still reachable over the bus
+        path = self.printer0.current_exposure
+        exposure0 = self.system_bus.get("cz.prusa3d.sl1.exposure0", path)
+        self.assertEqual(project, exposure0.project_file)
+        del exposure0
 
         # Make sure we are not keeping extra exposure objects
-        self.assertEqual(self._get_num_instances(Exposure0) - initial_exposure0, ActionManager.MAX_EXPOSURES)
-        self.assertEqual(self._get_num_instances(Exposure) - initial_exposure, ActionManager.MAX_EXPOSURES)
+        gc.collect()
+        self.assertEqual(len(instances[Exposure0]), ActionManager.MAX_EXPOSURES)
+        self.assertEqual(len(instances[Exposure]), ActionManager.MAX_EXPOSURES)
 
     def test_temps(self):
         # SL1S, M1 have UV temp on index 2, but the simulator does not reflect the change
@@ -200,18 +194,29 @@ class TestIntegrationPrinter0(SlaFwIntegrationTestCaseBase):
         else:
             raise NotImplementedError
 
+    def _track_instances(self, *instance_types: Type) -> Dict[Type, weakref.WeakSet]:
+        """
+        Record instances of the types constructed from now until the end of the test
+
+        Counting the live instances is then a set size instead of a walk over the whole heap.
+        """
+        instances: Dict[Type, weakref.WeakSet] = {}
+        for instance_type in instance_types:
+            tracked: weakref.WeakSet = weakref.WeakSet()
+            instances[instance_type] = tracked
+            patcher = patch.object(instance_type, "__init__", self._tracking_init(instance_type.__init__, tracked))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return instances
+
     @staticmethod
-    def _get_num_instances(instance_type: Type) -> int:
-        gc.collect()
-        counter = 0
-        for obj in gc.get_objects():
-            try:
-                if isinstance(obj, instance_type) and not isinstance(obj, weakref.ProxyTypes):
-                    counter += 1
-            except ReferenceError:
-                # Weak reference target just disappeared, does not count
-                pass
-        return counter
+    def _tracking_init(init, tracked: weakref.WeakSet):
+        @wraps(init)
+        def wrapper(obj, *args, **kwargs):
+            init(obj, *args, **kwargs)
+            tracked.add(obj)
+
+        return wrapper
 
 
 class TestIntegrationUnknownPrinter0(SlaFwIntegrationTestCaseBase):
@@ -222,7 +227,7 @@ class TestIntegrationUnknownPrinter0(SlaFwIntegrationTestCaseBase):
 
     def setUp(self):
         super().setUp()
-        self.printer0: Printer0 = pydbus.SystemBus().get("cz.prusa3d.sl1.printer0")
+        self.printer0: Printer0 = self.system_bus.get("cz.prusa3d.sl1.printer0")
 
     def test_unknown_model(self):
         self.assertEqual(Printer0State.EXCEPTION, Printer0State(self.printer0.state))
@@ -231,7 +236,7 @@ class TestIntegrationUnknownPrinter0(SlaFwIntegrationTestCaseBase):
 class TestIntegrationPrinter0Uncalibrated(SlaFwIntegrationTestCaseBase):
     def setUp(self):
         super().setUp()
-        self.printer0: Printer0 = pydbus.SystemBus().get("cz.prusa3d.sl1.printer0")
+        self.printer0: Printer0 = self.system_bus.get("cz.prusa3d.sl1.printer0")
         self.printer.hw.config.calibrated = False
 
     def tearDown(self):
@@ -271,13 +276,16 @@ class TestIntegrationPrinter0Uncalibrated(SlaFwIntegrationTestCaseBase):
         self.printer.hw.config.calibrated = False
         self.printer.hw.config.showWizard = False
 
+        # There might be a delay between inserting the media and running "make_ready_to_print"
+        wizard_started = Event()
+        self.printer.action_manager.wizard_started.connect(wizard_started.set)
+
         # Test print start
         # pylint: disable=protected-access
         self.printer._one_click_file(1, 2, 3, 4, [str(self.SAMPLES_DIR / ("numbers" + self.printer.hw.printer_model.extension))])
 
-        # There might be a delay between inserting the media and running "make_ready_to_print"
-        time.sleep(3)
-        wizard0: Wizard0 = pydbus.SystemBus().get("cz.prusa3d.sl1.wizard0")
+        self.assertTrue(wizard_started.wait(timeout=5))
+        wizard0: Wizard0 = self.system_bus.get("cz.prusa3d.sl1.wizard0")
 
         self.assertEqual(WizardId.CALIBRATION, WizardId(wizard0.identifier))
         wizard0.cancel()
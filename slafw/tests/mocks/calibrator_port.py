@@ -4,12 +4,19 @@
 # Copyright (C) 2020 Prusa Research a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from datetime import datetime
+from functools import lru_cache
 from queue import Queue
-from time import sleep
+from time import monotonic_ns
 
 from slafw import test_runtime
 
+_DONE = b"<done"
+
+
+@lru_cache(maxsize=256, typed=True)
+def _intensity_payload(intensity: float) -> bytes:
+    return ("<" + ",".join([str(intensity)] * 60) + ",347").encode()
+
 
 class Serial:
     def __init__(self):
@@ -18,7 +25,7 @@ class Serial:
         self._connect()
 
     def _connect(self):
-        self._data.put("<done".encode())
+        self._data.put(_DONE)
 
     def open(self):
         pass
@@ -35,21 +42,19 @@ class Serial:
             self._data.put(data)
             if (
                 test_runtime.uv_on_until
-                and test_runtime.uv_on_until > datetime.now()
+                and test_runtime.uv_on_until > monotonic_ns()
                 and not test_runtime.exposure_image.is_screen_black
             ):
                 intensity = self._intensity_response(test_runtime.uv_pwm)
             else:
                 intensity = 0
-            response = "<" + ",".join([str(intensity) for _ in range(60)]) + ",347"
-            self._data.put(response.encode())
+            self._data.put(_intensity_payload(intensity))
 
     def read(self):
         raise NotImplementedError()
 
     def readline(self):
         self._simulate_error()
-        sleep(0.1)
         return self._data.get()
 
     def _simulate_error(self):
@@ -59,7 +64,7 @@ class Serial:
         self._error_cnt += 1
         if self._error_cnt > test_runtime.uv_error_each:
             self._error_cnt = 0
-            self._data.put("<done".encode())
+            self._data.put(_DONE)
             raise IOError("Injected error")
 
     def inWaiting(self):
@@ -13,6 +13,15 @@ from slafw.api.decorators import dbus_api, auto_dbus, auto_dbus_signal
 
 # TODO replace for real file manager
 
+_METADATA = {
+    "files": Variant("a{sv}", {
+        "mtime": Variant("i", 1321321),
+        "origin": Variant("s", "local"),
+        "size": Variant("i", 1231321),
+    })
+}
+
+
 @dbus_api
 class FileManager0:
     """Dbus mock api for share file system data"""
@@ -21,6 +30,10 @@ class FileManager0:
 
     PropertiesChanged = signal()
 
+    def reset(self):
+        # Stateless, nothing to restore between tests
+        pass
+
     @auto_dbus_signal
     def MediaInserted(self, path: str):
         pass
@@ -35,13 +48,7 @@ class FileManager0:
 
     @auto_dbus
     def get_metadata(self, path: str, thumbnail: bool) -> Dict[str, Any]:
-        return {
-            "files": Variant("a{sv}", {
-                "mtime": Variant("i", 1321321),
-                "origin": Variant("s", "local"),
-                "size": Variant("i", 1231321),
-            })
-        }
+        return _METADATA
 
     @auto_dbus
     def get_all(self, maxdepth: int) -> Dict[str, Any]:
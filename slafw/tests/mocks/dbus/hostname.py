@@ -15,6 +15,9 @@ class Hostname:
     PropertiesChanged = signal()
 
     def __init__(self):
+        self.reset()
+
+    def reset(self):
         self.hostname = ""
         self.static_hostname = ""
 
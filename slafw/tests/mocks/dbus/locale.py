@@ -18,6 +18,9 @@ class Locale:
     PropertiesChanged = signal()
 
     def __init__(self):
+        self.reset()
+
+    def reset(self):
         self._locale = Locale.DEFAULT_LOCALE
 
     @auto_dbus
@@ -21,6 +21,9 @@ class NetworkManager:
         pass
 
     def __init__(self):
+        self.reset()
+
+    def reset(self):
         self._connections = ['ethernet', 'wifi0', 'wifi1']
         self.connections = self._connections.copy()
         self.iter = iter(self._connections)
@@ -18,6 +18,10 @@ class Systemd:
     def __init__(self):
         pass
 
+    def reset(self):
+        # Stateless, nothing to restore between tests
+        pass
+
     @auto_dbus
     def StopUnit(self, _: str, __: str) -> None:
         return None
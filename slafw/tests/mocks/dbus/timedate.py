@@ -17,6 +17,9 @@ class TimeDate:
     PropertiesChanged = signal()
 
     def __init__(self):
+        self.reset()
+
+    def reset(self):
         self._ntp = TimeDate.DEFAULT_NTP
         self._tz = TimeDate.DEFAULT_TZ
 
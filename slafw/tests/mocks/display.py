@@ -0,0 +1,21 @@
+# This file is part of the SLA firmware
+# Copyright (C) 2024 Prusa Research a.s. - www.prusa3d.com
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+class MockDisplayBase:
+    """
+    No-op output methods shared by the exposure screen and exposure image mocks
+    """
+
+    def start(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def blank_screen(self, sync: bool = True):
+        pass
+
+    def blank_area(self, area_index: int, sync: bool = True):
+        pass
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from PySignal import Signal
 
@@ -40,13 +41,17 @@ class Exposure:
                 },
                 warning = None,
         )
-        self.hw = HardwareMock(printer_model=PrinterModel.SL1)
         self.project = Project()
         self.progress = 0
         self.resin_volume = 42
         self.tower_position_nm = 424242
         self.warning_occurred = Signal()
 
+    @cached_property
+    def hw(self) -> HardwareMock:
+        # Created on first use, HardwareMock construction dominates the cost of this mock
+        return HardwareMock(printer_model=PrinterModel.SL1)
+
     def expected_finish_timestamp(self):
         return datetime.utcnow() + timedelta(milliseconds=self.estimate_remain_time_ms())
 
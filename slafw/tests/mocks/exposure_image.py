@@ -0,0 +1,41 @@
+# This file is part of the SLA firmware
+# Copyright (C) 2024 Prusa Research a.s. - www.prusa3d.com
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from slafw.project.project import Project
+from slafw.tests.mocks.display import MockDisplayBase
+
+
+class MockExposureImage(MockDisplayBase):
+    """
+    ExposureImage stand-in without the preloader process and shared memory
+
+    The preloader result is the fixed white_pixels value.
+    """
+
+    def __init__(self, white_pixels: int = 100):
+        self.white_pixels = white_pixels
+
+    def new_project(self, project: Project):
+        pass
+
+    def open_screen(self):
+        pass
+
+    def show_image_with_path(self, filename_with_path: str):
+        pass
+
+    def preload_image(self, layer_index: int):
+        pass
+
+    def sync_preloader(self) -> int:
+        return self.white_pixels
+
+    def blit_image(self):
+        pass
+
+    def screenshot_rename(self):
+        pass
+
+    def save_display_usage(self):
+        pass
@@ -5,26 +5,26 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from functools import cached_property
-from unittest.mock import Mock
 
 from slafw.hardware.exposure_screen import ExposureScreen, ExposureScreenParameters
+from slafw.tests.mocks.display import MockDisplayBase
 
 
-class MockExposureScreen(ExposureScreen):
-    # pylint: disable = too-few-public-methods
-    # pylint: disable = too-many-instance-attributes
+class MockExposureScreen(MockDisplayBase, ExposureScreen):
     def __init__(self, *_, **__):
         super().__init__()
 
-        self.start = Mock()
-        self.exit = Mock()
-        self.show = Mock()
-        self.blank_screen = Mock()
-        self.create_areas = Mock()
-        self.blank_area = Mock()
-        self.draw_pattern = Mock()
         self.fake_usage_s = 3600
 
+    def show(self, image, sync: bool = True):
+        pass
+
+    def create_areas(self, areas):
+        pass
+
+    def draw_pattern(self, drawfce, *args):
+        pass
+
     @cached_property
     def parameters(self) -> ExposureScreenParameters:
         return ExposureScreenParameters(
@@ -2,7 +2,9 @@
 # Copyright (C) 2021-2024 Prusa Research a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+from functools import cached_property, wraps
 from pathlib import Path
+from typing import Callable, TypeVar
 from unittest.mock import Mock
 
 from PySignal import Signal
@@ -18,6 +20,26 @@ from slafw.tests.mocks.motion_controller import MotionControllerMock
 from slafw.tests.mocks.temp_sensor import MockTempSensor
 from slafw.tests.mocks.uv_led import MockUVLED
 
+T = TypeVar("T")
+
+
+def _sub_device(factory: Callable[["HardwareMock"], T]) -> "cached_property[T]":
+    """
+    Lazily created and cached sub-device
+
+    An AttributeError raised by the factory would make Python fall back to __getattr__ and silently return a generic
+    Mock instead, report it as a RuntimeError.
+    """
+
+    @wraps(factory)
+    def wrapper(hw: "HardwareMock") -> T:
+        try:
+            return factory(hw)
+        except AttributeError as e:
+            raise RuntimeError(f"Failed to create mock {factory.__name__}") from e
+
+    return cached_property(wrapper)
+
 
 class HardwareMock(BaseHardware):
     # pylint: disable = too-many-instance-attributes
@@ -31,23 +53,40 @@ class HardwareMock(BaseHardware):
         super().__init__(config, printer_model)
         self.config = config
 
-        self.uv_led_temp = MockTempSensor(
+        self.power_led = Mock()
+        self.cover_state_changed = Signal()
+        self.mock_serial = "CZPX0819X009XC00151"
+        self.mock_is_kit = False
+        self.eth_mac = "10:9c:70:10:10:62"
+
+    # Sub-devices are created on first use, most tests touch only a few of them
+    @_sub_device
+    def uv_led_temp(self) -> MockTempSensor:
+        return MockTempSensor(
             "UV LED",
-            config.rpmControlUvLedMinTemp,
-            config.rpmControlUvLedMaxTemp,
+            self.config.rpmControlUvLedMinTemp,
+            self.config.rpmControlUvLedMaxTemp,
             critical=defines.maxUVTemp,
             hysteresis=defines.uv_temp_hysteresis,
             mock_value=Mock(return_value=46.7),
         )
-        self.ambient_temp = MockTempSensor(
+
+    @_sub_device
+    def ambient_temp(self) -> MockTempSensor:
+        return MockTempSensor(
             "Ambient",
             minimal=defines.minAmbientTemp,
             maximal=defines.maxAmbientTemp,
             mock_value=Mock(return_value=26.1),
         )
-        self.cpu_temp = MockTempSensor("CPU", mock_value=Mock(return_value=40))
 
-        self.uv_led_fan = MockFan(
+    @_sub_device
+    def cpu_temp(self) -> MockTempSensor:
+        return MockTempSensor("CPU", mock_value=Mock(return_value=40))
+
+    @_sub_device
+    def uv_led_fan(self) -> MockFan:
+        return MockFan(
             "UV LED",
             defines.fanMinRPM,
             defines.fanMaxRPM,
@@ -55,27 +94,47 @@ class HardwareMock(BaseHardware):
             reference=self.uv_led_temp,
             auto_control=self.config.rpmControlUvEnabled,
         )
-        self.blower_fan = MockFan("UV LED", defines.fanMinRPM, defines.fanMaxRPM, 3300)
-        self.rear_fan = MockFan("UV LED", defines.fanMinRPM, defines.fanMaxRPM, 1000)
-        self.exposure_screen = MockExposureScreen()
-        self.mcc = MotionControllerMock.get_6c()
-        self.power_led = Mock()
-        self.tower = MockTower(self.mcc, self.config, self.power_led, self.printer_model)
-        self.tilt = MockTilt(self.mcc, self.config, self.power_led, self.printer_model)
-        self.sl1s_booster = Mock()
-        self.sl1s_booster.board_serial_no = "FAKE BOOSTER SERIAL"
-        self.uv_led = MockUVLED()
+
+    @_sub_device
+    def blower_fan(self) -> MockFan:
+        return MockFan("UV LED", defines.fanMinRPM, defines.fanMaxRPM, 3300)
+
+    @_sub_device
+    def rear_fan(self) -> MockFan:
+        return MockFan("UV LED", defines.fanMinRPM, defines.fanMaxRPM, 1000)
+
+    @_sub_device
+    def exposure_screen(self) -> MockExposureScreen:
+        return MockExposureScreen()
+
+    @_sub_device
+    def mcc(self) -> MotionControllerMock:
+        return MotionControllerMock.get_6c()
+
+    @_sub_device
+    def tower(self) -> MockTower:
+        return MockTower(self.mcc, self.config, self.power_led, self.printer_model)
+
+    @_sub_device
+    def tilt(self) -> MockTilt:
+        return MockTilt(self.mcc, self.config, self.power_led, self.printer_model)
+
+    @_sub_device
+    def sl1s_booster(self) -> Mock:
+        booster = Mock()
+        booster.board_serial_no = "FAKE BOOSTER SERIAL"
+        return booster
+
+    @_sub_device
+    def uv_led(self) -> MockUVLED:
+        uv_led = MockUVLED()
 
         def update_expo_screen_usage(usage_s: int):
             if isinstance(self.exposure_screen, MockExposureScreen):
                 self.exposure_screen.fake_usage_s += usage_s
 
-        self.uv_led.usage_s_changed.connect(update_expo_screen_usage)
-
-        self.cover_state_changed = Signal()
-        self.mock_serial = "CZPX0819X009XC00151"
-        self.mock_is_kit = False
-        self.eth_mac = "10:9c:70:10:10:62"
+        uv_led.usage_s_changed.connect(update_expo_screen_usage)
+        return uv_led
 
     def motors_release(self) -> None:
         pass
@@ -153,8 +212,11 @@ class HardwareMock(BaseHardware):
         return (Mock, ())
 
     def __getattr__(self, name):
-        setattr(self, name, Mock())
-        return getattr(self, name)
+        # Stored on the instance, later lookups hit the instance dict. Not shared on the class so that call records
+        # do not leak between tests.
+        mock = Mock()
+        setattr(self, name, mock)
+        return mock
 
 
 def setupHw() -> HardwareMock:
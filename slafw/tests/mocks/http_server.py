@@ -3,21 +3,42 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 
-from http.server import SimpleHTTPRequestHandler, HTTPServer
+import atexit
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from threading import Thread
 
 from slafw.tests import samples
 
 
-class MockHandler(SimpleHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs, directory=Path(samples.__file__).parent)
+class MockHandler(BaseHTTPRequestHandler):
+    """
+    Serves the sample files preloaded in memory, no filesystem access per request
+    """
 
+    _FILES = {
+        "/mini_examples.tar.gz": (Path(samples.__file__).parent / "mini_examples.tar.gz").read_bytes(),
+    }
+
+    def do_GET(self):  # pylint: disable = invalid-name
+        data = self._FILES.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class MockServer(ThreadingHTTPServer, Thread):
+    daemon_threads = True
 
-class MockServer(HTTPServer, Thread):
     def __init__(self):
-        HTTPServer.__init__(self, ("", 8000), MockHandler)
+        # Loopback only, the port is picked by the kernel, see server_port
+        ThreadingHTTPServer.__init__(self, ("127.0.0.1", 0), MockHandler)
         Thread.__init__(self)
 
     def run(self):
@@ -26,3 +47,16 @@ class MockServer(HTTPServer, Thread):
     def stop(self):
         self.shutdown()
         self.join()
+
+
+@lru_cache(maxsize=1)
+def shared_mock_server() -> MockServer:
+    """
+    Mock server shared by all tests of the process, started on first use and stopped at exit
+    """
+    server = MockServer()
+    # Interpreter shutdown joins non-daemon threads before running atexit handlers
+    server.daemon = True
+    server.start()
+    atexit.register(server.stop)
+    return server
@@ -5,10 +5,11 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
+import os
 import re
-from datetime import datetime, timedelta
+import selectors
 from subprocess import Popen, PIPE, STDOUT
-from time import monotonic_ns, sleep
+from time import monotonic, monotonic_ns, sleep
 from typing import Optional
 
 from serial import SerialTimeoutException
@@ -17,23 +18,29 @@ from slafw import test_runtime
 
 
 class Serial:
-    TIMEOUT_MS = 3000
+    # Single pattern for all snooped commands, the matched group tells which one it was
+    CMD_RE = re.compile(b"!(?:upwm (?P<pwm>[0-9][0-9]*)|uled (?P<on>[01]) (?P<duration>[0-9][0-9]*))\n")
+
+    TIMEOUT_S = 3
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.pwm_re = re.compile(b"!upwm ([0-9][0-9]*)\n")
-        self.uled_re = re.compile(b"!uled ([01]) ([0-9][0-9]*)\n")
         self.process: Optional[Popen] = None
         self._is_open = False
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._rx_buffer = bytearray()
 
     def open(self):
         self._is_open = True
         self.process = Popen(  # pylint: disable = consider-using-with
             ["SLA-control-01.elf"], stdin=PIPE, stdout=PIPE, stderr=STDOUT
         )
-        mcusr = self.process.stdout.readline()
+        self._rx_buffer.clear()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.process.stdout, selectors.EVENT_READ)
+        mcusr = self._read_line()
         self.logger.debug("MC serial simulator MCUSR = %s", mcusr)
-        ready = self.process.stdout.readline()
+        ready = self._read_line()
         self.logger.debug("MC serial simulator ready = %s", ready)
         assert ready == b"ready\n"
         # Wait for MC sim to initialize
@@ -51,6 +58,9 @@ class Serial:
 
         :return: None
         """
+        if self._selector:
+            self._selector.close()
+            self._selector = None
         if self.process:
             self.process.terminate()
             self.process.wait(timeout=3)
@@ -79,31 +89,32 @@ class Serial:
         except IOError:
             self.logger.exception("Failed to write to simulated port")
 
+        cmd_match = self.CMD_RE.fullmatch(data)
+        if not cmd_match:
+            return
+
         # Decode UV PWM
-        pwm_match = self.pwm_re.fullmatch(data)
-        if pwm_match:
+        if cmd_match["pwm"] is not None:
             try:
-                test_runtime.uv_pwm = int(pwm_match.groups()[0].decode())
+                test_runtime.uv_pwm = int(cmd_match["pwm"])
                 self.logger.debug("UV PWM discovered: %d", test_runtime.uv_pwm)
-            except (IndexError, UnicodeDecodeError, ValueError):
+            except ValueError:
                 self.logger.exception("Failed to decode UV PWM from MC data")
+            return
 
         # Decode UV LED state
-        led_match = self.uled_re.fullmatch(data)
-        if led_match:
-            try:
-                on = led_match.groups()[0].decode() == "1"
-                duration_ms = int(led_match.groups()[1].decode())
-                self.logger.debug("UV LED state discovered: %d %d", on, duration_ms)
-                if on:
-                    if duration_ms:
-                        test_runtime.uv_on_until = datetime.now() + timedelta(milliseconds=duration_ms)
-                    else:
-                        test_runtime.uv_on_until = datetime.now() + timedelta(days=1)
-                else:
-                    test_runtime.uv_on_until = None
-            except (IndexError, UnicodeDecodeError, ValueError):
-                self.logger.exception("Failed to decode UV LED state from MC data")
+        try:
+            on_b, duration_b = cmd_match.group("on", "duration")
+            on = on_b == b"1"
+            duration_ms = int(duration_b)
+            self.logger.debug("UV LED state discovered: %d %d", on, duration_ms)
+            if on:
+                # Zero duration means on until switched off, use a day
+                test_runtime.uv_on_until = monotonic_ns() + (duration_ms or 86_400_000) * 1_000_000
+            else:
+                test_runtime.uv_on_until = None
+        except ValueError:
+            self.logger.exception("Failed to decode UV LED state from MC data")
 
     def read(self):
         """
@@ -119,18 +130,40 @@ class Serial:
 
         :return: Line read from simulated serial port
         """
-        start_ns = monotonic_ns()
+        line = self._read_line()
+        self.logger.debug("> %s", line)
+        return line
+
+    def _read_line(self) -> bytes:
+        """
+        Read one line from the simulator output
 
-        while monotonic_ns() - start_ns < self.TIMEOUT_MS * 1000:
-            # Unfortunately, there is no way how to make readline not block
+        Waits on the pipe descriptor and reads whatever is available in one go, lines are split from the buffer.
+
+        :return: Line including the trailing newline
+        """
+        deadline = monotonic() + self.TIMEOUT_S
+        while True:
+            end = self._rx_buffer.find(b"\n")
+            if end >= 0:
+                line = bytes(self._rx_buffer[: end + 1])
+                del self._rx_buffer[: end + 1]
+                return line
+            selector = self._selector
+            remaining = deadline - monotonic()
+            if not selector or remaining <= 0:
+                break
             try:
-                line = self.process.stdout.readline()
-            except ValueError:
+                if not selector.select(remaining):
+                    break
+                chunk = os.read(self.process.stdout.fileno(), 4096)
+            except (OSError, ValueError):
+                # Port closed while waiting
                 break
-            if line:
-                self.logger.debug("> %s", line)
-                return line
-            sleep(0.001)
+            if not chunk:
+                # EOF, the simulator is gone
+                break
+            self._rx_buffer += chunk
         raise SerialTimeoutException("Nothing to read from serial port")
 
     def inWaiting(self):
@@ -5,6 +5,7 @@
 
 # pylint: disable=too-few-public-methods
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable
 from unittest.mock import Mock
@@ -18,6 +19,18 @@ from slafw.functions.system import printer_model_regex
 from slafw.tests import samples
 
 
+@lru_cache(maxsize=1)
+def _download_regex(examples_url: str) -> re.Pattern:
+    # The pattern covers all printer models, it only depends on the URL template
+    return re.compile(examples_url.replace("{PRINTER_MODEL}", printer_model_regex(True)))
+
+
+@lru_cache(maxsize=1)
+def _mini_examples() -> bytes:
+    # Read once per test run, bytes are immutable and can be shared
+    return (Path(samples.__file__).parent / "mini_examples.tar.gz").read_bytes()
+
+
 class Network:
     def __init__(self, *_, **__):
         self.ip = "1.2.3.4"
@@ -37,14 +50,11 @@ class Network:
         file: BytesIO,
         progress_callback: Optional[Callable[[float], None]] = None,
     ):
-        dld_regex = re.compile(defines.examplesURL.replace("{PRINTER_MODEL}", printer_model_regex(True)))
-        if not dld_regex.match(url):
+        if not _download_regex(defines.examplesURL).match(url):
             raise ValueError(f"Unsupported mock url value: {url}")
-        mini_examples = Path(samples.__file__).parent / "mini_examples.tar.gz"
         progress_callback(0)
         progress_callback(1)
-        with open(mini_examples, "rb") as source:
-            file.write(source.read())
+        file.write(_mini_examples())
         file.seek(0)
         progress_callback(99)
         progress_callback(100)
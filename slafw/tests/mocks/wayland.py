@@ -4,7 +4,6 @@
 
 import mmap
 from unittest.mock import Mock
-from tempfile import TemporaryFile
 
 from slafw.hardware.exposure_screen import ExposureScreenParameters
 
@@ -22,11 +21,8 @@ class WaylandMock:
 
         self.main_layer = Mock()
         size = parameters.width_px * parameters.height_px * parameters.bytes_per_pixel
-        with TemporaryFile() as tf:
-            tf.truncate(size)
-            self.main_layer.shm_data = mmap.mmap(
-                tf.fileno(), size, prot=mmap.PROT_READ | mmap.PROT_WRITE, flags=mmap.MAP_SHARED
-            )
+        # Anonymous mapping, nothing reads the frame back from a file
+        self.main_layer.shm_data = mmap.mmap(-1, size)
         self.main_layer.width = parameters.width_px
         self.main_layer.height = parameters.height_px
         self.main_layer.bytes_per_pixel = parameters.bytes_per_pixel
@@ -3,9 +3,9 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import asyncio
-from asyncio import Task
-from threading import Thread, Event
-from typing import List, Optional
+from contextlib import suppress
+from typing import List
+from unittest import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
 
 from slafw.configs.hw import HwConfig
@@ -91,20 +91,17 @@ class TestSL1AmbientTempSensor(TestTempSensors):
             _ = self.sensor.value
 
 
-class TestA64CPUTempSensor(SlafwTestCase):
-    def setUp(self) -> None:
-        super().setUp()
+class TestA64CPUTempSensor(SlafwTestCase, IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
         self.temp = A64CPUTempSensor()
-        self._task: Optional[Task] = None
-        self._thread_running = Event()
-        self._thread = Thread(target=lambda: asyncio.run(self._task_body()), daemon=True)
-        self._thread.start()
-        self._thread_running.wait()
+        self._task = asyncio.create_task(self.temp.run())
 
-    def tearDown(self) -> None:
+    async def asyncTearDown(self) -> None:
         self._task.cancel()
-        self._thread.join()
-        super().tearDown()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        await super().asyncTearDown()
 
     def patches(self) -> List[patch]:
         self.sensor_path = self.TEMP_DIR / "cputemp"
@@ -114,16 +111,11 @@ class TestA64CPUTempSensor(SlafwTestCase):
             patch("slafw.hardware.a64.temp_sensor.A64CPUTempSensor.UPDATE_INTERVAL_S", 0),
         ]
 
-    async def _task_body(self):
-        self._task = asyncio.create_task(self.temp.run())
-        self._thread_running.set()
-        await self._task
-
     def test_read(self):
         self.assertAlmostEqual(10, self.temp.value)
 
-    def test_signal(self):
-        event = Event()
+    async def test_signal(self):
+        event = asyncio.Event()
         callback = Mock()
 
         def on_change(new_value):
@@ -131,6 +123,6 @@ class TestA64CPUTempSensor(SlafwTestCase):
             callback(new_value)
 
         self.temp.value_changed.connect(on_change)
-        self._task.get_loop().call_soon_threadsafe(lambda: self.sensor_path.write_text("20000"))
-        event.wait(5)
+        self.sensor_path.write_text("20000")
+        await asyncio.wait_for(event.wait(), 5)
         callback.assert_called_with(20)
@@ -2,11 +2,13 @@
 # Copyright (C) 2020 Prusa Research a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import os
 import re
 import unittest
 from dataclasses import fields, is_dataclass
-from glob import glob
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Iterator
 
 from gi.repository.GLib import Variant
 from prusaerrors.sl1.codes import Sl1Codes
@@ -19,6 +21,50 @@ from slafw.api.decorators import wrap_dict_data
 from slafw.errors.tests import FAKE_ARGS, get_classes, get_instance
 
 
+def _escape_percent(message: str) -> str:
+    """Double every standalone '%' not followed by a named placeholder"""
+    if "%" not in message:
+        return message
+    parts = message.split("%")
+    escaped = [parts[0]]
+    for part in parts[1:]:
+        escaped.append("%" if part.startswith("(") else "%%")
+        escaped.append(part)
+    return "".join(escaped)
+
+
+@lru_cache(maxsize=None)
+def _cached_instance(cls) -> Exception:
+    """Single fake instance per exception class, shared by the tests"""
+    return get_instance(cls)
+
+
+@lru_cache(maxsize=None)
+def _substitution_arguments(cls) -> Dict[str, Any]:
+    """Message substitution arguments for the exception class, as the UI would fill them"""
+    instance = _cached_instance(cls)
+    arguments: Dict[str, Any] = {}
+    if is_dataclass(instance):
+        for field in fields(instance):
+            if field.name.endswith("__map_HardwareDeviceId"):
+                # Sensor name is special. UI looks it up in an enum dictionary and translates name.
+                arguments[field.name] = HardwareDeviceId(FAKE_ARGS[field.name]).name
+            else:
+                arguments[field.name] = FAKE_ARGS[field.name]
+    return arguments
+
+
+def _python_sources(root: str) -> Iterator[str]:
+    """Lazily walk the tree yielding python source paths, hidden directories are skipped as glob does"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith("."):
+                    yield from _python_sources(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+
 class TestExceptions(unittest.TestCase):
     """
     This automatically tests exception instantiation and DBus wrapping
@@ -27,39 +73,32 @@ class TestExceptions(unittest.TestCase):
     exported to DBus.
     """
 
+    # Sl1Codes is generated from the error codes Yaml, collect its names once
+    SL1_CODE_NAMES = frozenset(dir(Sl1Codes))
+
+    @classmethod
+    def setUpClass(cls):
+        # Classes are generated from the error codes, enumerate them once for all tests
+        cls.classes = tuple(get_classes())
+
     def test_instantiation(self):
-        for name, cls in get_classes():
-            print(f"Testing dbus wrapping for class: {name}")
-            wrapped_exception = PrinterException.as_dict(get_instance(cls))
-            wrapped_dict = wrap_dict_data(wrapped_exception)
-            self.assertIsInstance(wrapped_dict, dict)
-            for key, value in wrapped_dict.items():
-                self.assertIsInstance(key, str)
-                self.assertIsInstance(value, Variant)
-
-    @staticmethod
-    def test_string_substitution():
-        for name, cls in get_classes():
-            print(f"\nTesting string substitution for class: {name}.")
-
-            instance = get_instance(cls)
-            message = cls.CODE.message
-            print(f'Source text:\n"{message}"')
-
-            arguments = {}
-            if is_dataclass(instance):
-                for field in fields(instance):
-                    if field.name.endswith("__map_HardwareDeviceId"):
-                        # Sensor name is special. UI looks it up in an enum dictionary and translates name.
-                        arguments[field.name] = HardwareDeviceId(FAKE_ARGS[field.name]).name
-                    else:
-                        arguments[field.name] = FAKE_ARGS[field.name]
-
-            print(f"Arguments:{arguments}")
-
-            # Note simplified processing in the UI does not have problems with standalone '%' character.
-            substituted = re.sub(r"%(?!\()", "%%", message) % arguments
-            print(f'Substituted text:\n"{substituted}"')
+        for name, cls in self.classes:
+            with self.subTest(name):
+                wrapped_exception = PrinterException.as_dict(_cached_instance(cls))
+                wrapped_dict = wrap_dict_data(wrapped_exception)
+                self.assertIsInstance(wrapped_dict, dict)
+                self.assertTrue(
+                    all(isinstance(key, str) and isinstance(value, Variant) for key, value in wrapped_dict.items()),
+                    f"Expected str keys and Variant values: {wrapped_dict}",
+                )
+
+    def test_string_substitution(self):
+        for name, cls in self.classes:
+            with self.subTest(name, message=cls.CODE.message):
+                arguments = _substitution_arguments(cls)
+                # Note simplified processing in the UI does not have problems with standalone '%' character.
+                substituted = _escape_percent(cls.CODE.message) % arguments
+                self.assertIsInstance(substituted, str)
 
     def test_error_codes_dummy(self):
         """This is a stupid test that checks all attempts to use Sl1Codes.UNKNOWN likes are valid. Pylint cannot do
@@ -67,13 +106,15 @@ class TestExceptions(unittest.TestCase):
 
         # This goes through all the source code looking for Sl1Codes usages and checks whenever these are legit.
         root = Path(slafw.__file__).parent
-        sources = [Path(source) for source in glob(str(root / "**/*.py"), recursive=True)]
-        code_pattern = re.compile(r"(?<=Sl1Codes\.)\w+")
-        for source in sources:
-            text = source.read_text()
-            matches = code_pattern.findall(text)
-            for match in matches:
-                self.assertIn(match, dir(Sl1Codes))
+        # Single pass per file, only usages not naming a known code match
+        known = b"|".join(re.escape(name.encode("ascii")) for name in self.SL1_CODE_NAMES)
+        invalid_code_pattern = re.compile(rb"(?<=Sl1Codes\.)(?!(?:" + known + rb")\b)\w+")
+        for source in _python_sources(str(root)):
+            # The pattern is ASCII, no need to decode whole files
+            with open(source, "rb") as f:
+                text = f.read()
+            invalid = invalid_code_pattern.search(text)
+            self.assertIsNone(invalid, f"Unknown Sl1Codes.{invalid and invalid.group().decode('ascii')} in {source}")
 
 
 if __name__ == "__main__":
@@ -3,10 +3,11 @@
 # Copyright (C) 2018-2024 Prusa Research a.s. - www.prusa3d.com
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import logging
 import unittest
 from pathlib import Path
-from time import sleep
-from typing import Optional
+from threading import Event
+from typing import Callable, Optional
 
 from unittest.mock import Mock, patch, MagicMock, AsyncMock, call
 
@@ -30,9 +31,12 @@ from slafw.exposure.profiles import EXPOSURE_PROFILES_DEFAULT_NAME, \
     ExposureProfileSL1, SingleLayerProfileSL1
 from slafw.exposure.persistence import ExposurePickler
 from slafw.states.exposure import ExposureState
+from slafw.tests.mocks.exposure_image import MockExposureImage
 from slafw.tests.mocks.hardware import HardwareMock, setupHw
 from slafw.wizard.data_package import WizardDataPackage
 
+logger = logging.getLogger(__name__)
+
 
 @patch("slafw.exposure.exposure.sleep", Mock()) # do it faster, much faster ;-)
 class TestExposure(SlafwTestCaseDBus, RefCheckTestCase):
@@ -48,10 +52,7 @@ class TestExposure(SlafwTestCaseDBus, RefCheckTestCase):
     def setUp(self):
         super().setUp()
         self.hw = setupHw()
-        self.exposure_image = Mock()
-        self.exposure_image.__class__ = ExposureImage
-        self.exposure_image.__reduce__ = lambda x: (Mock, ())
-        self.exposure_image.sync_preloader.return_value = 100
+        self.exposure_image = MockExposureImage()
         self.pickler = ExposurePickler(WizardDataPackage(self.hw, None, None, self.exposure_image))
 
     def tearDown(self):
@@ -108,25 +109,29 @@ class TestExposure(SlafwTestCaseDBus, RefCheckTestCase):
         self.assertNotEqual(exposure.state, ExposureState.FAILURE)
         self.assertIsNone(exposure.data.warning)
 
-    def test_resin_enough(self):
-        hw = setupHw()
-        hw.get_resin_volume_async = AsyncMock(return_value = defines.resinMaxVolume)
-        exposure = self._wait_exposure(self._start_exposure(hw))
-        self.assertNotEqual(exposure.state, ExposureState.FAILURE)
-        self.assertIsNone(exposure.data.warning)
-
-    def test_resin_warning(self):
-        hw = setupHw()
-        hw.get_resin_volume_async = AsyncMock(return_value = defines.resinMinVolume + 0.1)
-        exposure = self._wait_exposure(self._start_exposure(hw))
-        self.assertIsInstance(exposure.data.fatal_error, WarningEscalation)
-        self.assertIsInstance(exposure.data.fatal_error.warning, ResinNotEnough)  # pylint: disable=no-member
-
-    def test_resin_error(self):
-        hw = setupHw()
-        hw.get_resin_volume_async = AsyncMock(return_value = defines.resinMinVolume - 0.1)
-        exposure = self._wait_exposure(self._start_exposure(hw))
-        self.assertIsInstance(exposure.data.fatal_error, ResinTooLow)
+    def test_resin_volume(self):
+        cases = (
+            (defines.resinMaxVolume, None, None),
+            (defines.resinMinVolume + 0.1, WarningEscalation, ResinNotEnough),
+            (defines.resinMinVolume - 0.1, ResinTooLow, None),
+        )
+        for volume, fatal_type, warning_type in cases:
+            with self.subTest(volume=volume):
+                # Fresh hardware per case, a failed case must not affect the others
+                hw = setupHw()
+                try:
+                    hw.get_resin_volume_async = AsyncMock(return_value=volume)
+                    exposure = self._wait_exposure(self._start_exposure(hw))
+                    if fatal_type is None:
+                        self.assertNotEqual(exposure.state, ExposureState.FAILURE)
+                        self.assertIsNone(exposure.data.warning)
+                    else:
+                        self.assertIsInstance(exposure.data.fatal_error, fatal_type)
+                    if warning_type is not None:
+                        # pylint: disable=no-member
+                        self.assertIsInstance(exposure.data.fatal_error.warning, warning_type)
+                finally:
+                    hw.exit()
 
     def test_broken_empty_project(self):
         exposure = Exposure(0, self.pickler.package)
@@ -134,67 +139,61 @@ class TestExposure(SlafwTestCaseDBus, RefCheckTestCase):
             exposure.read_project(self.BROKEN_EMPTY_PROJECT)
         self.assertIsInstance(exposure.data.fatal_error, ProjectErrorCantRead)
 
-    def test_stuck_recovery_success(self):
-        hw = setupHw()
-        hw.tilt.layer_peel_moves = MagicMock(side_effect=TiltHomeFailed())
-        exposure = self._start_exposure(hw)
+    def test_stuck_recovery(self):
+        def recover(hw: HardwareMock):
+            hw.tilt.layer_peel_moves = MagicMock()
 
-        for i in range(30):
-            print(f"Waiting for exposure {i}, state: ", exposure.state)
-            if exposure.state == ExposureState.CHECK_WARNING:
-                print(exposure.data.warning)
-                if isinstance(exposure.data.warning, PrintingDirectlyFromMedia):
-                    exposure.confirm_print_warning()
-                else:
-                    exposure.reject_print_warning()
-            if exposure.state in ExposureState.finished_states():
-                self._exposure_check(exposure)
-                self.assertEqual(exposure.state, ExposureState.FINISHED)
-                return
-            if exposure.state == ExposureState.STUCK:
-                hw.tilt.layer_peel_moves = MagicMock()
-                exposure.doContinue()
-            if exposure.state == ExposureState.POUR_IN_RESIN:
-                exposure.confirm_resin_in()
-            sleep(1)
+        def fail_recovery(hw: HardwareMock):
+            hw.tilt.sync_ensure = MagicMock(side_effect=TiltHomeFailed())
 
-        raise TimeoutError("Waiting for exposure failed")
+        for on_stuck, expected_state in ((recover, ExposureState.FINISHED), (fail_recovery, ExposureState.FAILURE)):
+            with self.subTest(expected_state=expected_state):
+                # Fresh hardware per case, the recovery actions modify it
+                hw = setupHw()
+                try:
+                    self._check_stuck_recovery(hw, on_stuck, expected_state)
+                finally:
+                    hw.exit()
 
-    def test_stuck_recovery_fail(self):
-        hw = setupHw()
+    def _check_stuck_recovery(
+            self, hw: HardwareMock, on_stuck: Callable[[HardwareMock], None], expected_state: ExposureState):
         hw.tilt.layer_peel_moves = MagicMock(side_effect=TiltHomeFailed())
         exposure = self._start_exposure(hw)
+        state_changed = self._state_changed_event(exposure)
 
         for i in range(30):
-            print(f"Waiting for exposure {i}, state: ", exposure.state)
+            state_changed.clear()
+            logger.debug("Waiting for exposure %d, state: %s", i, exposure.state)
             if exposure.state == ExposureState.CHECK_WARNING:
-                print(exposure.data.warning)
+                logger.debug("Warning: %s", exposure.data.warning)
                 if isinstance(exposure.data.warning, PrintingDirectlyFromMedia):
                     exposure.confirm_print_warning()
                 else:
                     exposure.reject_print_warning()
             if exposure.state in ExposureState.finished_states():
                 self._exposure_check(exposure)
-                self.assertEqual(exposure.state, ExposureState.FAILURE)
+                self.assertEqual(exposure.state, expected_state)
                 return
             if exposure.state == ExposureState.STUCK:
-                hw.tilt.sync_ensure = MagicMock(side_effect=TiltHomeFailed())
+                on_stuck(hw)
                 exposure.doContinue()
             if exposure.state == ExposureState.POUR_IN_RESIN:
                 exposure.confirm_resin_in()
-            sleep(1)
+            state_changed.wait(1)
 
         raise TimeoutError("Waiting for exposure failed")
 
     def test_resin_refilled(self):
-        hw = setupHw()
+        hw = self.hw
         fake_resin_volume = 100.0
         hw.get_resin_volume_async = AsyncMock(return_value = fake_resin_volume)
         exposure = self._start_exposure(hw)
+        state_changed = self._state_changed_event(exposure)
         feedme_done = False
 
         for i in range(60):
-            print(f"Waiting for exposure {i}, state: ", exposure.state)
+            state_changed.clear()
+            logger.debug("Waiting for exposure %d, state: %s", i, exposure.state)
             if exposure.state == ExposureState.PRINTING:
                 if not feedme_done:
                     self.assertLess(exposure.resin_volume, defines.resinMaxVolume)
@@ -209,19 +208,21 @@ class TestExposure(SlafwTestCaseDBus, RefCheckTestCase):
                 return
             if exposure.state == ExposureState.POUR_IN_RESIN:
                 exposure.confirm_resin_in()
-            sleep(0.5)
+            state_changed.wait(0.5)
 
         raise TimeoutError("Waiting for exposure failed")
 
     def test_resin_not_refilled(self):
-        hw = setupHw()
+        hw = self.hw
         fake_resin_volume = 100.0
         hw.get_resin_volume.return_value = fake_resin_volume
         exposure = self._start_exposure(hw)
+        state_changed = self._state_changed_event(exposure)
         feedme_done = False
 
         for i in range(60):
-            print(f"Waiting for exposure {i}, state: ", exposure.state)
+            state_changed.clear()
+            logger.debug("Waiting for exposure %d, state: %s", i, exposure.state)
             if exposure.state == ExposureState.PRINTING:
                 if not feedme_done:
                     exposure.doFeedMe()
@@ -235,14 +236,14 @@ class TestExposure(SlafwTestCaseDBus, RefCheckTestCase):
             if exposure.state in ExposureState.finished_states():
                 self.assertNotEqual(exposure.state, ExposureState.FAILURE)
                 return
-            sleep(0.5)
+            state_changed.wait(0.5)
 
         raise TimeoutError("Waiting for exposure failed")
 
     def test_exposure_force_slow_tilt(self):
         defines.livePreviewImage = str(self.TEMP_DIR / "live.png")
         defines.displayUsageData = str(self.TEMP_DIR / "display_usage.npz")
-        hw = setupHw()
+        hw = self.hw
         exposure_image = ExposureImage(hw)
         exposure_image.start()
 
@@ -309,11 +310,25 @@ class TestExposure(SlafwTestCaseDBus, RefCheckTestCase):
         exposure.confirm_print_start()
         return exposure
 
+    @staticmethod
+    def _state_changed_event(exposure: Exposure) -> Event:
+        """
+        Event set whenever the exposure state changes, pollers wait on it instead of sleeping
+
+        Clear it before reading the state, a change in between then ends the following wait immediately.
+        """
+        event = Event()
+        # Lambda as PySignal keeps only a weak reference to plain functions
+        exposure.data.changed.connect(lambda key, _: key == "state" and event.set())
+        return event
+
     def _wait_exposure(self, exposure: Exposure) -> Exposure:
+        state_changed = self._state_changed_event(exposure)
         for i in range(50):
-            print(f"Waiting for exposure {i}, state: ", exposure.state)
+            state_changed.clear()
+            logger.debug("Waiting for exposure %d, state: %s", i, exposure.state)
             if exposure.state == ExposureState.CHECK_WARNING:
-                print(exposure.data.warning)
+                logger.debug("Warning: %s", exposure.data.warning)
                 if isinstance(exposure.data.warning, PrintingDirectlyFromMedia):
                     exposure.confirm_print_warning()
                 else:
@@ -322,13 +337,13 @@ class TestExposure(SlafwTestCaseDBus, RefCheckTestCase):
                 return self._exposure_check(exposure)
             if exposure.state == ExposureState.POUR_IN_RESIN:
                 exposure.confirm_resin_in()
-            sleep(1)
+            state_changed.wait(1)
 
         raise TimeoutError("Waiting for exposure failed")
 
     @staticmethod
     def _exposure_check(exposure: Exposure):
-        print("Running exposure check")
+        logger.debug("Running exposure check")
         if exposure.state not in ExposureState.finished_states():
             exposure.doExitPrint()
         exposure.waitDone()
@@ -353,10 +368,7 @@ class TestLayers(SlafwTestCaseDBus):
         self.hw.start()
         self.hw.config.uvPwm = 250
         self.hw.config.calibrated = True
-        self.exposure_image = Mock()
-        self.exposure_image.__class__ = ExposureImage
-        self.exposure_image.__reduce__ = lambda x: (Mock, ())
-        self.exposure_image.sync_preloader.return_value = 100
+        self.exposure_image = MockExposureImage()
 
         self.hw.tower.move_ensure_async = AsyncMock()
         self.hw.tilt.layer_up_wait_async = AsyncMock()
@@ -566,58 +578,56 @@ class TestLayers(SlafwTestCaseDBus):
         ep = ExposureProfileSL1(
             default_file_path=exposure_profiles_path)
         # start - first layers (3 + numFade)
-        test_parameters = {
-                "actual_layer_profile" : ep.above_area_fill,
-                "actual_layer" : 0,
-                "white_pixels" : 100}
-        print("start_inside")
-        self._check_layer_variant(test_parameters, expected_results["start_inside"])
+        logger.debug("start_inside")
+        self._check_layer_variant(
+            expected_results["start_inside"], layer_profile=ep.above_area_fill, actual_layer=0, white_pixels=100)
         for i in range(12):
-            print(i)
-            self._check_layer_variant({}, expected_results["start_inside"])
-        print("start_last")
-        self._check_layer_variant({}, expected_results["start_last"])
-        print("start_outside")
+            logger.debug("Layer %d", i)
+            self._check_layer_variant(expected_results["start_inside"])
+        logger.debug("start_last")
+        self._check_layer_variant(expected_results["start_last"])
+        logger.debug("start_outside")
         for i in range(10):
-            print(i)
-            self._check_layer_variant({}, expected_results["start_outside"])
+            logger.debug("Layer %d", i)
+            self._check_layer_variant(expected_results["start_outside"])
 
         # big exposured area (are_fill and 1 mm after)
-        test_parameters = { "actual_layer" : 1000, "white_pixels" : 40000}
-        print("big_first")
-        self._check_layer_variant(test_parameters, expected_results["big_first"])
-        print("big_inside")
+        logger.debug("big_first")
+        self._check_layer_variant(expected_results["big_first"], actual_layer=1000, white_pixels=40000)
+        logger.debug("big_inside")
         for i in range(5):
-            print(i)
-            self._check_layer_variant({}, expected_results["big_inside"])
-        self._check_layer_variant({"white_pixels" : 100}, expected_results["big_inside"])
+            logger.debug("Layer %d", i)
+            self._check_layer_variant(expected_results["big_inside"])
+        self._check_layer_variant(expected_results["big_inside"], white_pixels=100)
         for i in range(19):
-            print(i)
-            self._check_layer_variant({}, expected_results["big_inside"])
-        print("big_last")
-        self._check_layer_variant({}, expected_results["big_last"])
-        print("big_outside")
+            logger.debug("Layer %d", i)
+            self._check_layer_variant(expected_results["big_inside"])
+        logger.debug("big_last")
+        self._check_layer_variant(expected_results["big_last"])
+        logger.debug("big_outside")
         for i in range(10):
-            print(i)
-            self._check_layer_variant({}, expected_results["big_outside"])
+            logger.debug("Layer %d", i)
+            self._check_layer_variant(expected_results["big_outside"])
 
-        print("last")
-        self._check_layer_variant({}, expected_results["last"], last = True)
+        logger.debug("last")
+        self._check_layer_variant(expected_results["last"], last=True)
 
-    def _check_layer_variant(self, test_parameters, expected_result, last = False):
+    def _check_layer_variant(
+            self, expected_result, layer_profile=None, actual_layer=None, white_pixels=None, last=False):
+        """Run one frame, layer parameters left as None keep their previous value (the layer number increments)"""
         # pylint: disable = protected-access
         self.hw.tower.move_ensure_async.reset_mock()
         self.hw.tilt.layer_up_wait_async.reset_mock()
         self.hw.tilt.layer_down_wait_async.reset_mock()
         self.sleep_mock.reset_mock()
-        if "actual_layer_profile" in test_parameters:
-            self.exposure.actual_layer_profile = test_parameters["actual_layer_profile"]
-        if "actual_layer" in test_parameters:
-            self.exposure.data.actual_layer = test_parameters["actual_layer"]
+        if layer_profile is not None:
+            self.exposure.actual_layer_profile = layer_profile
+        if actual_layer is not None:
+            self.exposure.data.actual_layer = actual_layer
         else:
             self.exposure.data.actual_layer += 1
-        if "white_pixels" in test_parameters:
-            self.exposure_image.sync_preloader.return_value = test_parameters["white_pixels"]
+        if white_pixels is not None:
+            self.exposure_image.white_pixels = white_pixels
         success, _ = self.exposure._do_frame((100,), False, 50000, last)
         self.assertTrue(success)
 #        print(f"move_ensure_async: {self.hw.tower.move_ensure_async.call_args_list}")
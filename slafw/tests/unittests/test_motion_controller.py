@@ -50,3 +50,14 @@ class TestMotionController(SlafwTestCase):
         ):  # fw rev 5, board rev 6c
             with self.assertRaises(MotionControllerWrongFw):
                 self.mcc.connect(mc_version_check=False)
+
+    def test_state_bits_cached(self) -> None:
+        bits = [False] * 16
+        with patch.object(self.mcc, "doGetBoolList", Mock(return_value=bits)) as get_bits:
+            self.mcc.getStateBits(["cover"], check_for_updates=False)
+            self.mcc.getStateBits(["tower"], check_for_updates=False)
+            get_bits.assert_called_once()
+            self.mcc.getStateBits(["tower"], check_for_updates=True)
+            # The update check may query other values (fans), count only the state bits reads
+            state_reads = [c for c in get_bits.call_args_list if c.args[0] == "?"]
+            self.assertEqual(2, len(state_reads))
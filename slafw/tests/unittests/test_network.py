@@ -12,7 +12,7 @@ from unittest.mock import Mock
 from slafw.libNetwork import Network
 from slafw.tests import samples
 from slafw.tests.base import SlafwTestCaseDBus, RefCheckTestCase
-from slafw.tests.mocks.http_server import MockServer
+from slafw.tests.mocks.http_server import shared_mock_server
 
 
 class MockHandler(SimpleHTTPRequestHandler):
@@ -23,20 +23,14 @@ class MockHandler(SimpleHTTPRequestHandler):
 class TestExamples(SlafwTestCaseDBus, RefCheckTestCase):
     def setUp(self) -> None:
         super().setUp()
-        self.server = MockServer()
-        self.server.start()
-
-    def tearDown(self) -> None:
-        self.server.stop()
-        super().tearDown()
+        self.server = shared_mock_server()
 
     def test_download(self):
-        # pylint: disable = no-self-use
         network = Network("TEST", "1.0.0")
         with TemporaryFile() as temp:
             callback = Mock()
             network.download_url(
-                "http://localhost:8000/mini_examples.tar.gz",
+                f"http://127.0.0.1:{self.server.server_port}/mini_examples.tar.gz",
                 temp,
                 progress_callback=callback,
             )